@@ -36,9 +36,13 @@ def _sha3_256_hex(s: str) -> str:
     return hashlib.sha3_256(s.encode("utf-8")).hexdigest()
 
 
-def iter_audits() -> Iterator[AuditRecord]:
+def iter_audits(date_prefix: Optional[str] = None) -> Iterator[AuditRecord]:
     """
     Yield AuditRecord items from the log (skip malformed or invalid lines).
+
+    When date_prefix is given (e.g. "2023-09-30"), lines whose timestamp
+    does not start with it are skipped before model validation, so a
+    single-day read does not pay Pydantic construction for the whole log.
     """
     if not AUDIT_FILE.exists():
         return
@@ -47,8 +51,17 @@ def iter_audits() -> Iterator[AuditRecord]:
             line = raw.strip()
             if not line:
                 continue
+            # A record whose timestamp starts with the prefix necessarily
+            # contains it, so a C-level substring check skips most
+            # non-matching lines without even parsing the JSON
+            if date_prefix is not None and date_prefix not in line:
+                continue
             try:
                 data: Dict[str, Any] = json.loads(line)
+                if date_prefix is not None and not str(
+                    data.get("timestamp", "")
+                ).startswith(date_prefix):
+                    continue
                 yield AuditRecord(**data)
             except (json.JSONDecodeError, TypeError, ValueError, ValidationError):
                 # Skip malformed or invalid record lines
@@ -63,6 +76,20 @@ def _last_hash() -> Optional[str]:
     return getattr(last, "chain_hash", None) if last else None
 
 
+# In-memory chain tip so each append avoids replaying the whole log file.
+# The size snapshot detects a log that was truncated, rotated, or swapped
+# underneath us (e.g. tests pointing AUDIT_FILE at a fresh path).
+_chain_tip: Optional[str] = None
+_chain_tip_size: Optional[int] = None
+
+
+def _audit_file_size() -> int:
+    try:
+        return AUDIT_FILE.stat().st_size
+    except OSError:
+        return 0
+
+
 # ---------- Public API ----------
 def append_audit(rec: AuditRecord) -> None:
     """
@@ -70,7 +97,13 @@ def append_audit(rec: AuditRecord) -> None:
 
     chain_hash = SHA3-256(prev_hash + canonical_json(payload_without_hashes))
     """
-    prev: str = _last_hash() or GENESIS_PREV
+    global _chain_tip, _chain_tip_size
+
+    size = _audit_file_size()
+    if _chain_tip is not None and _chain_tip_size == size:
+        prev: str = _chain_tip
+    else:
+        prev = _last_hash() or GENESIS_PREV
 
     # Build payload excluding hashes for canonicalization
     payload: Dict[str, Any] = {
@@ -91,6 +124,8 @@ def append_audit(rec: AuditRecord) -> None:
 
     with AUDIT_FILE.open("a", encoding="utf-8") as f:
         f.write(rec.model_dump_json() + "\n")
+        _chain_tip = chain
+        _chain_tip_size = f.tell()
 
 
 def verify_chain() -> Dict[str, Any]:
@@ -135,8 +170,4 @@ def get_records_by_date_prefix(date_prefix: Optional[str] = None) -> List[AuditR
     If date_prefix is None, returns all records.
     Date prefix should be in format like "2023-09-30" to match timestamps.
     """
-    records = []
-    for record in iter_audits():
-        if date_prefix is None or record.timestamp.startswith(date_prefix):
-            records.append(record)
-    return records
+    return list(iter_audits(date_prefix=date_prefix))
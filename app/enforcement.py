@@ -1,8 +1,10 @@
 # app/enforcement.py
 from datetime import datetime, timezone
 from typing import Dict, Tuple, List, Optional, Any
+import asyncio
 import fnmatch
 import re
+import time
 
 from app.models import AuditRecord, Rule
 from app.audit import append_audit
@@ -14,8 +16,17 @@ try:
 except ImportError:
     RISK_SCORING_AVAILABLE = False
 
+# Optional Aho-Corasick prefilter: one linear scan over the text finds which
+# rules' required literals are present, so regexes only run for candidates.
+try:
+    import ahocorasick  # pip install pyahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # --- LLM policy check using OpenAI v1 SDK (lazy init to avoid noise) ---
 _openai_client: Optional[Any] = None
+_openai_async_client: Optional[Any] = None
 
 
 def _ensure_openai():
@@ -30,6 +41,18 @@ def _ensure_openai():
             _openai_client = False  # mark unavailable (no warning spam)
 
 
+def _ensure_openai_async():
+    """Lazy-initialize the async OpenAI client; mark as unavailable on failure."""
+    global _openai_async_client
+    if _openai_async_client is None:
+        try:
+            from openai import AsyncOpenAI  # pip install openai
+
+            _openai_async_client = AsyncOpenAI()  # reads OPENAI_API_KEY
+        except Exception:
+            _openai_async_client = False  # mark unavailable (no warning spam)
+
+
 def llm_policy_check(text: str, prompt: str, model: str = "gpt-4o-mini") -> bool:
     """
     Returns True when the LLM indicates the text violates the policy (e.g., answers 'Yes').
@@ -67,6 +90,40 @@ def llm_policy_check(text: str, prompt: str, model: str = "gpt-4o-mini") -> bool
         return False
 
 
+async def llm_policy_check_async(
+    text: str, prompt: str, model: str = "gpt-4o-mini"
+) -> bool:
+    """
+    Async counterpart of llm_policy_check, used to fan out multiple LLM rule
+    checks concurrently. Same fail-safe semantics: False on any error.
+    """
+    _ensure_openai_async()
+    if _openai_async_client is False:
+        return False
+    try:
+        chat = getattr(_openai_async_client, "chat", None)
+        completions = getattr(chat, "completions", None) if chat else None
+        if completions is None or not hasattr(completions, "create"):
+            return False
+        resp = await completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": text},
+            ],
+            max_tokens=50,
+            temperature=0,
+        )  # type: ignore
+        choices = getattr(resp, "choices", None)
+        if not choices or not hasattr(choices[0], "message"):
+            return False
+        message = getattr(choices[0], "message", None)
+        content = getattr(message, "content", "")
+        return (content or "").strip().lower().startswith("yes")
+    except Exception:
+        return False
+
+
 def _regex_hit(
     compiled_regex: Optional[re.Pattern[str]], text: str, min_count: Optional[int]
 ) -> bool:
@@ -87,6 +144,159 @@ def _regex_hit(
         return False
 
 
+# Secret-detection rule family. Specific rules are ordered before the generic
+# API-1.0 rule so the combined regex prefers the specific alternative.
+SPECIFIC_SECRET_IDS = {
+    "GITHUB-TOKEN-1.0",
+    "AWS-ACCESS-KEY-1.0",
+    "AWS-SECRET-KEY-1.0",
+    "OPENAI-KEY-1.0",
+    "SLACK-BOT-1.0",
+    "GOOGLE-API-KEY-1.0",
+    "STRIPE-KEY-1.0",
+    "JWT-1.0",
+}
+_COMBINED_SECRET_ORDER = (
+    "GITHUB-TOKEN-1.0",
+    "AWS-ACCESS-KEY-1.0",
+    "AWS-SECRET-KEY-1.0",
+    "OPENAI-KEY-1.0",
+    "SLACK-BOT-1.0",
+    "GOOGLE-API-KEY-1.0",
+    "STRIPE-KEY-1.0",
+    "JWT-1.0",
+    "API-1.0",
+)
+
+# Cache of combined secret regexes keyed like the prefilter cache.
+_combined_secret_cache: Dict[int, Tuple[Tuple[str, ...], Any, set, Dict[str, Any]]] = {}
+
+
+def _get_combined_secret_regex(
+    rules_store: Dict[str, Any],
+) -> Tuple[Optional[re.Pattern[str]], set, Dict[str, re.Pattern]]:
+    """
+    Compile the secret-rule family into one alternation of lookaheads so a
+    single scan finds every position where any secret rule fires. The scan
+    only locates candidate positions: re reports one alternative per
+    position, so each covered rule keeps its own compiled pattern for
+    confirmation. Returns (regex or None, covered rule ids, rule id->pattern).
+    """
+    key = id(rules_store)
+    snapshot = tuple(rules_store.keys())
+    cached = _combined_secret_cache.get(key)
+    if cached and cached[0] == snapshot:
+        return cached[1], cached[2], cached[3]
+
+    parts: List[str] = []
+    covered: set = set()
+    rid_patterns: Dict[str, re.Pattern] = {}
+    try:
+        for rid in _COMBINED_SECRET_ORDER:
+            entry = rules_store.get(rid)
+            if entry is None:
+                continue
+            rule = entry[0] if isinstance(entry, tuple) else entry
+            pattern = getattr(rule, "pattern", None)
+            # Only pure single-hit regex rules can be folded into the combined scan.
+            if not pattern or (getattr(rule, "min_count", 1) or 1) > 1:
+                continue
+            # Zero-width lookahead so one rule's match cannot consume text that
+            # another (overlapping) rule also needs to see.
+            parts.append(f"(?={pattern})")
+            covered.add(rid)
+            rid_patterns[rid] = re.compile(pattern)
+
+        combined: Optional[re.Pattern[str]] = None
+        if len(parts) >= 2:
+            combined = re.compile("|".join(parts))
+        else:
+            covered = set()
+            rid_patterns = {}
+    except re.error:
+        # Incompatible sub-patterns (e.g. inline flags); fall back to
+        # per-rule evaluation.
+        combined = None
+        covered = set()
+        rid_patterns = {}
+
+    if len(_combined_secret_cache) > 8:
+        _combined_secret_cache.clear()
+    _combined_secret_cache[key] = (snapshot, combined, covered, rid_patterns)
+    return combined, covered, rid_patterns
+
+
+# Literals shorter than this are too common to be a useful prefilter.
+_PREFILTER_MIN_LITERAL = 3
+
+# Cache of built automatons keyed by id(rules_store); the key snapshot lets us
+# detect a store that was rebuilt or mutated and rebuild the automaton.
+_prefilter_cache: Dict[int, Tuple[Tuple[str, ...], Any, set]] = {}
+
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """
+    Extract a literal substring that every match of `pattern` must contain
+    (e.g. 'ghp_' for GitHub tokens, 'AKIA' for AWS access keys).
+
+    Conservative: only a plain literal prefix (after optional zero-width
+    anchors) qualifies, and patterns with inline flags or alternation yield
+    None so they are never filtered out incorrectly.
+    """
+    if not pattern or pattern.startswith("(?") or "|" in pattern:
+        return None
+    body = pattern[1:] if pattern.startswith("^") else pattern
+    # \b and \A are zero-width, so any literal that follows them is still
+    # required text; without this the shipped rules (all \b-anchored) would
+    # never be covered by the prefilter.
+    while body.startswith(("\\b", "\\A")):
+        body = body[2:]
+    literal_chars: List[str] = []
+    for ch in body:
+        if ch in ".^$*+?{}[]()\\|":
+            # A trailing quantifier makes the previous char optional.
+            if ch in "*?{" and literal_chars:
+                literal_chars.pop()
+            break
+        literal_chars.append(ch)
+    literal = "".join(literal_chars)
+    return literal if len(literal) >= _PREFILTER_MIN_LITERAL else None
+
+
+def _get_prefilter(rules_store: Dict[str, Any]) -> Tuple[Any, set]:
+    """
+    Build (or fetch cached) the Aho-Corasick automaton over rule literals.
+    Returns (automaton, set of rule ids covered by the prefilter).
+    """
+    key = id(rules_store)
+    snapshot = tuple(rules_store.keys())
+    cached = _prefilter_cache.get(key)
+    if cached and cached[0] == snapshot:
+        return cached[1], cached[2]
+
+    literals: Dict[str, set] = {}
+    for rid, entry in rules_store.items():
+        rule = entry[0] if isinstance(entry, tuple) else entry
+        pattern = getattr(rule, "pattern", None)
+        literal = _required_literal(pattern) if pattern else None
+        if literal:
+            literals.setdefault(literal, set()).add(rid)
+
+    automaton = None
+    prefilter_rids: set = set()
+    if literals:
+        automaton = ahocorasick.Automaton()
+        for literal, rids in literals.items():
+            automaton.add_word(literal, frozenset(rids))
+            prefilter_rids |= rids
+        automaton.make_automaton()
+
+    if len(_prefilter_cache) > 8:  # bound memory across rule reloads
+        _prefilter_cache.clear()
+    _prefilter_cache[key] = (snapshot, automaton, prefilter_rids)
+    return automaton, prefilter_rids
+
+
 def _endpoint_matches(
     rule_endpoints: Optional[List[str]], endpoint: Optional[str]
 ) -> bool:
@@ -113,26 +323,55 @@ def _endpoint_matches(
     return False
 
 
-def evaluate(
+def _collect_matches(
     text: str,
-    agent_id: str,
     rules_store: Dict[str, Any],
-    direction: Optional[str] = None,
-    endpoint: Optional[str] = None,
-):
+    direction: Optional[str],
+    endpoint: Optional[str],
+) -> Tuple[List[Tuple[Rule, str]], List[Tuple[Rule, str]]]:
     """
-    Evaluate text against rules. Each store entry is typically (Rule, compiled_regex),
-    but we tolerate (Rule,), (Rule, regex, ...extras), or just Rule.
-
-    Supports: regex, min_count, max_chars, llm_prompt, and scoping by direction/endpoint.
-
-    Returns: (decision, rule_ids, enforce_even_in_shadow)
+    Run the regex/length portion of evaluation and return
+    (matched, pending_llm) where pending_llm holds in-scope rules that did not
+    hit yet but define an llm_prompt. The caller decides whether those LLM
+    checks run serially (sync path) or concurrently (async path).
     """
     matched: List[Tuple[Rule, str]] = []
-
-    # normalize direction to avoid case mismatches
-    if direction:
-        direction = direction.lower().strip()
+    pending_llm: List[Tuple[Rule, str]] = []
+
+    # 0) Aho-Corasick prefilter: one scan of the text tells us which rules'
+    # required literals are present; only those rules need their regex run.
+    prefilter_candidates: Optional[set] = None
+    prefilter_rids: set = set()
+    if AHOCORASICK_AVAILABLE and rules_store:
+        automaton, prefilter_rids = _get_prefilter(rules_store)
+        if automaton is not None:
+            prefilter_candidates = set()
+            for _, rids in automaton.iter(text):
+                prefilter_candidates |= rids
+
+    # 0b) Combined secret scan: one pass over the text resolves the whole
+    # secret-rule family instead of one regex scan per rule.
+    combined_rids: set = set()
+    combined_hits: set = set()
+    if rules_store:
+        combined_regex, combined_rids, rid_patterns = _get_combined_secret_regex(
+            rules_store
+        )
+        if combined_regex is not None:
+            # The alternation reports only one winning alternative per
+            # position, so its matches are candidates: confirm every not-yet-
+            # hit rule at each position with its own pattern, so overlapping
+            # rules are all attributed.
+            remaining = dict(rid_patterns)
+            for m in combined_regex.finditer(text):
+                if not remaining:
+                    break
+                pos = m.start()
+                for rid in [
+                    rid for rid, pat in remaining.items() if pat.match(text, pos)
+                ]:
+                    combined_hits.add(rid)
+                    del remaining[rid]
 
     # 1) Collect matches (robust unpacking)
     for rid, entry in rules_store.items():
@@ -157,8 +396,6 @@ def evaluate(
         hit = False
 
         # Regex (with optional min_count)
-        import re
-
         regex_arg: Optional[re.Pattern[str]] = (
             compiled_regex if isinstance(compiled_regex, re.Pattern) else None
         )
@@ -166,8 +403,19 @@ def evaluate(
         if regex_arg is None and hasattr(rule, 'compiled_pattern') and rule.compiled_pattern:
             regex_arg = rule.compiled_pattern
         
-        if _regex_hit(regex_arg, text, rule.min_count):
-            hit = True
+        if rid in combined_rids:
+            # Already resolved by the single combined secret scan.
+            hit = rid in combined_hits
+        else:
+            # Skip regex when the prefilter proved the required literal is
+            # absent.
+            skip_regex = (
+                prefilter_candidates is not None
+                and rid in prefilter_rids
+                and rid not in prefilter_candidates
+            )
+            if not skip_regex and _regex_hit(regex_arg, text, rule.min_count):
+                hit = True
 
         # Length threshold
         max_chars = rule.max_chars
@@ -179,25 +427,25 @@ def evaluate(
             if max_chars_int is not None and len(text) > max_chars_int:
                 hit = True
 
-        # LLM policy check (only if still no hit and rule has llm_prompt)
+        # LLM policy check is deferred to the caller (serial or concurrent)
         if not hit and rule.llm_prompt:
-            if llm_policy_check(text, rule.llm_prompt):
-                hit = True
+            pending_llm.append((rule, rid))
+            continue
 
         if hit:
             matched.append((rule, rid))
 
+    return matched, pending_llm
+
+
+def _finalize_decision(
+    matched: List[Tuple[Rule, str]],
+    text: str,
+    direction: Optional[str],
+    endpoint: Optional[str],
+) -> Tuple[str, List[str], bool]:
+    """Apply suppression/precedence/shadow-override rules and write the audit."""
     # 2) Suppress generic API-1.0 if a specific secret matched
-    SPECIFIC_SECRET_IDS = {
-        "GITHUB-TOKEN-1.0",
-        "AWS-ACCESS-KEY-1.0",
-        "AWS-SECRET-KEY-1.0",
-        "OPENAI-KEY-1.0",
-        "SLACK-BOT-1.0",
-        "GOOGLE-API-KEY-1.0",
-        "STRIPE-KEY-1.0",
-        "JWT-1.0",
-    }
     matched_ids = {rid for _, rid in matched}
     if "API-1.0" in matched_ids and (matched_ids & SPECIFIC_SECRET_IDS):
         matched = [(r, r_id) for (r, r_id) in matched if r_id != "API-1.0"]
@@ -220,6 +468,7 @@ def evaluate(
     # 5) Audit - provide default values for CLI usage
     from app.util import gen_request_id
 
+    excerpt = text[:200]  # sliced once; reused by append_audit's chain hash
     record = AuditRecord(
         timestamp=datetime.now(timezone.utc).isoformat(),
         request_id=gen_request_id(),
@@ -227,7 +476,7 @@ def evaluate(
         direction=direction or "unknown",
         endpoint=endpoint or "cli",
         rule_ids=rule_ids,
-        text_excerpt=text[:200],
+        text_excerpt=excerpt,
         text_hash="",  # Will be filled by append_audit
         previous_hash="",  # Will be filled by append_audit
     )
@@ -236,17 +485,79 @@ def evaluate(
     return decision, rule_ids, enforce_even_in_shadow
 
 
+def evaluate(
+    text: str,
+    agent_id: str,
+    rules_store: Dict[str, Any],
+    direction: Optional[str] = None,
+    endpoint: Optional[str] = None,
+):
+    """
+    Evaluate text against rules. Each store entry is typically (Rule, compiled_regex),
+    but we tolerate (Rule,), (Rule, regex, ...extras), or just Rule.
+
+    Supports: regex, min_count, max_chars, llm_prompt, and scoping by direction/endpoint.
+
+    Returns: (decision, rule_ids, enforce_even_in_shadow)
+    """
+    # normalize direction to avoid case mismatches
+    if direction:
+        direction = direction.lower().strip()
+
+    matched, pending_llm = _collect_matches(text, rules_store, direction, endpoint)
+
+    # LLM policy checks run serially in the sync path
+    for rule, rid in pending_llm:
+        if llm_policy_check(text, rule.llm_prompt):
+            matched.append((rule, rid))
+
+    return _finalize_decision(matched, text, direction, endpoint)
+
+
+async def evaluate_async(
+    text: str,
+    agent_id: str,
+    rules_store: Dict[str, Any],
+    direction: Optional[str] = None,
+    endpoint: Optional[str] = None,
+):
+    """
+    Async variant of evaluate: regex/length checks run inline, but all LLM
+    policy checks are dispatched concurrently with asyncio.gather so total
+    latency is bounded by the slowest call instead of their sum.
+
+    Returns: (decision, rule_ids, enforce_even_in_shadow)
+    """
+    if direction:
+        direction = direction.lower().strip()
+
+    matched, pending_llm = _collect_matches(text, rules_store, direction, endpoint)
+
+    if pending_llm:
+        results = await asyncio.gather(
+            *(llm_policy_check_async(text, rule.llm_prompt) for rule, _ in pending_llm),
+            return_exceptions=True,
+        )
+        for (rule, rid), verdict in zip(pending_llm, results):
+            if verdict is True:
+                matched.append((rule, rid))
+
+    return _finalize_decision(matched, text, direction, endpoint)
+
+
 def apply_shadow_logic(decision: str, rule_ids: List[str]) -> Tuple[str, str]:
     """
     Apply shadow mode logic to a decision.
     Returns (raw_decision, effective_decision).
     """
-    import os
-    from config.loader import get_current_config
-    
-    cfg = get_current_config()
-    shadow_mode = cfg.app.shadow_mode if cfg and cfg.app else os.environ.get("JIMINI_SHADOW", "false").lower() == "true"
-    
+    from config import loader as config_loader
+
+    # Trigger the lazy config load once; afterwards the resolved shadow-mode
+    # flag is a single module-attribute read per decision.
+    if config_loader._config_instance is None:
+        config_loader.get_current_config()
+    shadow_mode = config_loader.current_shadow_mode
+
     # If not in shadow mode, return decision as-is
     if not shadow_mode:
         return decision, decision
@@ -276,8 +587,8 @@ def evaluate_with_risk_assessment(
     
     Returns: (decision, rule_ids, enforce_even_in_shadow, risk_assessment)
     """
-    start_time = datetime.now()
-    
+    start_ns = time.perf_counter_ns()
+
     # Perform standard policy evaluation
     decision, rule_ids, enforce_even_in_shadow = evaluate(
         text, agent_id, rules_store, direction, endpoint
@@ -311,8 +622,8 @@ def evaluate_with_risk_assessment(
                 message="Policy evaluation completed"
             )
             
-            # Calculate processing time
-            processing_time = (datetime.now() - start_time).total_seconds()
+            # Calculate processing time (monotonic, no datetime allocation)
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Perform risk assessment
             assessment = assess_request_risk(request, response, processing_time)
@@ -1,9 +1,29 @@
 import json
 import ssl
 import urllib.request
+import zlib
 from typing import List, Dict, Any
 from app.forwarders.base import ResilientForwarder
 
+# orjson (Rust-based) serializes several times faster than stdlib json and
+# returns bytes directly; fall back to json.dumps when not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# urllib3 gives us a pooled keep-alive connection so each batch skips the
+# TCP+TLS handshake; fall back to one-shot urllib.request when unavailable.
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+# Process-wide SSL contexts, built once and shared by every forwarder
+# instance so OpenSSL can reuse its session cache across connections.
+_VERIFIED_CTX = ssl.create_default_context()
+_UNVERIFIED_CTX = ssl._create_unverified_context()
+
 
 class SplunkHECForwarder(ResilientForwarder):
     def __init__(
@@ -12,29 +32,105 @@ class SplunkHECForwarder(ResilientForwarder):
         token: str,
         sourcetype: str = "jimini:event",
         verify: bool = True,
+        gzip: bool = False,
+        gzip_level: int = 6,
+        max_batch_events: int = 1000,
+        max_batch_bytes: int = 1024 * 1024,
     ):
         super().__init__("splunk", max_retries=2, base_delay=0.2)
         self.url = url
         self.token = token
         self.sourcetype = sourcetype
-        self.ctx = None if verify else ssl._create_unverified_context()
+        self.gzip = gzip
+        self.gzip_level = gzip_level
+        # Oversized caller batches are split at these thresholds so a burst
+        # cannot produce an unbounded POST body or overload the HEC endpoint.
+        self.max_batch_events = max_batch_events
+        self.max_batch_bytes = max_batch_bytes
+        self.ctx = _VERIFIED_CTX if verify else _UNVERIFIED_CTX
+        # Pooled keep-alive client, reused across batches and retries so only
+        # the first batch pays the TLS handshake.
+        if urllib3 is not None:
+            self._http = urllib3.PoolManager(
+                num_pools=1,
+                maxsize=4,
+                cert_reqs="CERT_REQUIRED" if verify else "CERT_NONE",
+                ssl_context=self.ctx,
+            )
+        else:
+            self._http = None
+        # Constant HEC envelope framing, precomputed once so each event only
+        # pays for its own serialization (no per-event wrapper dict).
+        sourcetype_json = json.dumps(sourcetype)
+        self._envelope_prefix = (
+            b'{"sourcetype":' + sourcetype_json.encode("utf-8") + b',"event":'
+        )
+        self._envelope_suffix = b"}"
 
     def _send_batch(self, events: List[Dict[str, Any]]):
-        """Send batch to Splunk HEC endpoint"""
-        payload = []
+        """Send batch to Splunk HEC, early-flushing at the size thresholds"""
+        prefix, suffix = self._envelope_prefix, self._envelope_suffix
+        chunk: List[bytes] = []
+        chunk_bytes = 0
         for e in events:
-            payload.append({"event": e, "sourcetype": self.sourcetype})
-        data = ("\n".join(json.dumps(x) for x in payload)).encode("utf-8")
+            if orjson is not None:
+                # orjson emits bytes, so no separate .encode() copy is needed
+                framed = prefix + orjson.dumps(e) + suffix + b"\n"
+            else:
+                framed = prefix + json.dumps(e).encode("utf-8") + suffix + b"\n"
+            if chunk and (
+                len(chunk) >= self.max_batch_events
+                or chunk_bytes + len(framed) > self.max_batch_bytes
+            ):
+                self._post(chunk)
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(framed)
+            chunk_bytes += len(framed)
+        if chunk:
+            self._post(chunk)
 
+    def _post(self, fragments: List[bytes]):
+        """POST one bounded payload to the HEC endpoint"""
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Splunk {self.token}",
         }
 
-        req = urllib.request.Request(url=self.url, data=data)
-        # Add headers explicitly to avoid urllib's automatic Content-Type setting
-        for key, value in headers.items():
-            req.add_header(key, value)
+        # Opt-in gzip: JSON logs compress 5-15x, a large win for remote HEC.
+        # wbits=31 produces a gzip-framed stream without a second full copy.
+        if self.gzip:
+            compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+            data = compressor.compress(b"".join(fragments)) + compressor.flush()
+            headers["Content-Encoding"] = "gzip"
+        else:
+            data = None
+
+        if self._http is not None:
+            if data is None:
+                # Hand urllib3 the per-event fragments as a chunked body
+                # (writev-style): no full-batch contiguous copy is built.
+                resp = self._http.request(
+                    "POST",
+                    self.url,
+                    body=iter(fragments),
+                    headers=headers,
+                    chunked=True,
+                    timeout=10,
+                )
+            else:
+                resp = self._http.request(
+                    "POST", self.url, body=data, headers=headers, timeout=10
+                )
+            if resp.status >= 400:
+                raise RuntimeError(f"Splunk HEC returned HTTP {resp.status}")
+        else:
+            if data is None:
+                data = b"".join(fragments)
+            req = urllib.request.Request(url=self.url, data=data)
+            # Add headers explicitly to avoid urllib's automatic Content-Type setting
+            for key, value in headers.items():
+                req.add_header(key, value)
 
-        with urllib.request.urlopen(req, context=self.ctx, timeout=10) as _:
-            pass
+            with urllib.request.urlopen(req, context=self.ctx, timeout=10) as _:
+                pass
@@ -8,46 +8,69 @@ Core intelligence capabilities for Jimini policy gateway:
 
 Export structure provides clean access to intelligence capabilities while maintaining
 modular architecture for future enhancements.
+
+Submodules pull in numpy/sklearn/spaCy transitively, so exports resolve
+lazily via PEP 562 __getattr__: importing app.intelligence stays cheap and
+each heavy dependency loads only when its symbol is first touched.
 """
 
+import importlib
+
 # Phase 6C - Policy Recommendations (core implementation)
-from .policy_recommendations import (
-    PolicyRecommendationEngine, PolicyConflict, PolicyRecommendation, 
-    CoverageGap, RecommendationType, RecommendationPriority, ConflictType,
-    get_policy_recommendation_engine
+_POLICY_RECOMMENDATIONS = (
+    'PolicyRecommendationEngine',
+    'PolicyConflict',
+    'PolicyRecommendation',
+    'CoverageGap',
+    'RecommendationType',
+    'RecommendationPriority',
+    'ConflictType',
+    'get_policy_recommendation_engine',
 )
-from .policy_recommendations_api import create_policy_recommendations_router
 
 # Phase 6D - Predictive Policy Intelligence (advanced forecasting)
-from .predictive_intelligence import (
-    PredictiveIntelligenceEngine,
-    get_predictive_engine,
-    ThreatPrediction,
-    PolicyTuningRecommendation,
-    AnomalyForecast,
-    ZeroDayPattern,
-    PredictionConfidence,
-    ThreatTrend,
-    predict_threats,
-    generate_tuning_recommendations,
-    forecast_anomalies,
-    generate_zero_day_patterns
+_PREDICTIVE_INTELLIGENCE = (
+    'PredictiveIntelligenceEngine',
+    'get_predictive_engine',
+    'ThreatPrediction',
+    'PolicyTuningRecommendation',
+    'AnomalyForecast',
+    'ZeroDayPattern',
+    'PredictionConfidence',
+    'ThreatTrend',
+    'predict_threats',
+    'generate_tuning_recommendations',
+    'forecast_anomalies',
+    'generate_zero_day_patterns',
 )
-from .predictive_intelligence_api import router as predictive_intelligence_router
 
 # Phase 7 - Reinforcement Learning Framework (contextual optimization)
-from .reinforcement_learning import (
-    PolicyOptimizer,
-    ContextualBandit,
-    ThompsonSampler,
-    RLContext,
-    RLReward,
-    PolicyAction,
-    ExplorationStrategy,
-    policy_optimizer,
-    initialize_rl_framework
+_REINFORCEMENT_LEARNING = (
+    'PolicyOptimizer',
+    'ContextualBandit',
+    'ThompsonSampler',
+    'RLContext',
+    'RLReward',
+    'PolicyAction',
+    'ExplorationStrategy',
+    'policy_optimizer',
+    'initialize_rl_framework',
 )
-from .reinforcement_learning_api import rl_router
+
+# Exported name -> (module, attribute) for lazy resolution
+_LAZY = {name: ('app.intelligence.policy_recommendations', name)
+         for name in _POLICY_RECOMMENDATIONS}
+_LAZY.update({name: ('app.intelligence.predictive_intelligence', name)
+              for name in _PREDICTIVE_INTELLIGENCE})
+_LAZY.update({name: ('app.intelligence.reinforcement_learning', name)
+              for name in _REINFORCEMENT_LEARNING})
+_LAZY['create_policy_recommendations_router'] = (
+    'app.intelligence.policy_recommendations_api', 'create_policy_recommendations_router'
+)
+_LAZY['predictive_intelligence_router'] = (
+    'app.intelligence.predictive_intelligence_api', 'router'
+)
+_LAZY['rl_router'] = ('app.intelligence.reinforcement_learning_api', 'rl_router')
 
 __all__ = [
     # Phase 6C - Policy Recommendations
@@ -56,11 +79,11 @@ __all__ = [
     'PolicyRecommendation',
     'CoverageGap',
     'RecommendationType',
-    'RecommendationPriority', 
+    'RecommendationPriority',
     'ConflictType',
     'get_policy_recommendation_engine',
     'create_policy_recommendations_router',
-    
+
     # Phase 6D - Predictive Intelligence
     'PredictiveIntelligenceEngine',
     'get_predictive_engine',
@@ -75,7 +98,7 @@ __all__ = [
     'forecast_anomalies',
     'generate_zero_day_patterns',
     'predictive_intelligence_router',
-    
+
     # Phase 7 - Reinforcement Learning
     'PolicyOptimizer',
     'ContextualBandit',
@@ -87,4 +110,19 @@ __all__ = [
     'policy_optimizer',
     'initialize_rl_framework',
     'rl_router'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """PEP 562 lazy export: import the owning submodule on first access."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # cache so subsequent lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,15 +4,32 @@ REST API endpoints for AI-powered regulatory analysis and rule generation
 """
 
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, BackgroundTasks
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+# orjson serializes large job/rule trees 5-6x faster than stdlib json;
+# fall back to the stdlib-backed JSONResponse when it is not installed.
+try:
+    import orjson  # noqa: F401  (required by ORJSONResponse at render time)
+    from fastapi.responses import ORJSONResponse
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSONResponse = JSONResponse  # type: ignore[assignment,misc]
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
+from collections import OrderedDict
 from enum import Enum
+import concurrent.futures
+import itertools
+import os
+import io
+import shutil
 import tempfile
 import json
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 import asyncio
+import time
 
 from app.intelligence.regulatory_parser import (
     RegulatoryTextParser, RegulationType, RequirementType,
@@ -25,7 +42,11 @@ from app.util import get_logger
 logger = get_logger(__name__)
 
 # Initialize router
-intelligence_router = APIRouter(prefix="/v1/intelligence", tags=["intelligence"])
+intelligence_router = APIRouter(
+    prefix="/v1/intelligence",
+    tags=["intelligence"],
+    default_response_class=ORJSONResponse,
+)
 
 # Global parser instance
 parser_instance: Optional[RegulatoryTextParser] = None
@@ -126,9 +147,64 @@ class BatchAnalysisRequest(BaseModel):
     max_rules_per_document: Optional[int] = Field(default=50, ge=1, le=100)
 
 
-# In-memory storage for processing jobs (in production, use Redis or database)
-processing_jobs: Dict[str, ProcessingJob] = {}
-approved_rules: Dict[str, Dict[str, Any]] = {}
+class BoundedDict(OrderedDict):
+    """
+    Size-bounded dict with LRU eviction: inserts refresh recency and the
+    least-recently-inserted entry is dropped once max_size is exceeded.
+    An optional on_evict callback lets owners clean up side indexes.
+    """
+
+    def __init__(self, max_size: int = 10000, on_evict=None):
+        super().__init__()
+        self.max_size = max_size
+        self._on_evict = on_evict
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.max_size:
+            evicted_key, evicted_value = self.popitem(last=False)
+            logger.info(f"Evicted {evicted_key} from bounded store (cap {self.max_size})")
+            if self._on_evict is not None:
+                self._on_evict(evicted_key, evicted_value)
+
+
+# Sort index of (started_at timestamp, processing_id), so listing jobs sorts
+# small tuples instead of fully materialized job dicts.
+_jobs_index: List[tuple] = []
+
+# Direct rule_id -> rule lookup so approval is O(1) instead of scanning
+# every rule of every job.
+rule_index: Dict[str, GeneratedRuleResponse] = {}
+
+# JSON-bytes snapshot per job, captured when the job reaches a terminal
+# state, so listing jobs is byte concatenation instead of a Pydantic walk.
+_job_snapshots: Dict[str, bytes] = {}
+
+
+def _evict_job(job_id: str, job: "ProcessingJob") -> None:
+    """Keep the side indexes consistent when a job ages out of the store."""
+    _jobs_index[:] = [entry for entry in _jobs_index if entry[1] != job_id]
+    _invalidate_job_snapshot(job_id)
+    if job.rules:
+        for rule in job.rules:
+            rule_index.pop(rule.rule_id, None)
+
+
+# In-memory storage for processing jobs (in production, use Redis or database);
+# bounded so long-running deployments cannot grow without limit.
+processing_jobs: Dict[str, ProcessingJob] = BoundedDict(on_evict=_evict_job)
+approved_rules: Dict[str, Dict[str, Any]] = BoundedDict()
+
+
+def _snapshot_job(job: ProcessingJob) -> None:
+    """Cache the serialized form of a terminal (completed/failed) job."""
+    if orjson is not None:
+        _job_snapshots[job.id] = orjson.dumps(job.dict(), default=str)
+
+
+def _invalidate_job_snapshot(job_id: str) -> None:
+    _job_snapshots.pop(job_id, None)
 
 
 def get_parser() -> RegulatoryTextParser:
@@ -139,6 +215,37 @@ def get_parser() -> RegulatoryTextParser:
     return parser_instance
 
 
+# Process pool for CPU-bound document parsing so spaCy/transformers work does
+# not block the event loop. Each worker builds its own parser on first use.
+_parser_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_worker_parser: Optional[RegulatoryTextParser] = None
+
+
+def _init_parser_worker() -> None:
+    """Pool initializer: build the per-process parser once."""
+    global _worker_parser
+    _worker_parser = RegulatoryTextParser()
+
+
+def _parse_document_worker(file_path: str, regulation_type: RegulationType):
+    """Run a parse inside a pool worker using its process-local parser."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = RegulatoryTextParser()
+    return _worker_parser.parse_regulation_document(file_path, regulation_type)
+
+
+def _get_parser_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Lazily create the shared parser process pool."""
+    global _parser_pool
+    if _parser_pool is None:
+        _parser_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_parser_worker,
+        )
+    return _parser_pool
+
+
 def convert_requirement_to_response(req: PolicyRequirement) -> RequirementResponse:
     """Convert PolicyRequirement to response model."""
     return RequirementResponse(
@@ -175,6 +282,46 @@ def convert_rule_to_response(rule: GeneratedRule) -> GeneratedRuleResponse:
     )
 
 
+def requirement_to_dict(req: PolicyRequirement) -> Dict[str, Any]:
+    """
+    JSON-only fast path: build the response dict straight from the parsed
+    requirement, skipping Pydantic field validation when no model contract
+    is involved.
+    """
+    return {
+        "id": req.id,
+        "regulation_type": req.regulation_type.value,
+        "requirement_type": req.requirement_type.value,
+        "title": req.title,
+        "description": req.description,
+        "regulatory_section": req.regulatory_section,
+        "severity": req.severity,
+        "confidence_score": req.confidence_score,
+        "suggested_action": req.suggested_action,
+        "data_types": req.data_types,
+        "applicable_contexts": req.applicable_contexts,
+    }
+
+
+def rule_to_dict(rule: GeneratedRule) -> Dict[str, Any]:
+    """JSON-only fast path counterpart of convert_rule_to_response."""
+    return {
+        "rule_id": rule.rule_id,
+        "name": rule.name,
+        "description": rule.description,
+        "pattern": rule.pattern,
+        "llm_prompt": rule.llm_prompt,
+        "action": rule.action,
+        "confidence_score": rule.confidence_score,
+        "applies_to": rule.applies_to,
+        "endpoints": rule.endpoints,
+        "yaml_content": rule.yaml_content,
+        "requires_approval": rule.requires_approval,
+        "approved_by": rule.approved_by,
+        "approved_at": rule.approved_at.isoformat() if rule.approved_at else None,
+    }
+
+
 @intelligence_router.get("/status")
 async def get_intelligence_status() -> JSONResponse:
     """Get intelligence system status and capabilities."""
@@ -182,7 +329,7 @@ async def get_intelligence_status() -> JSONResponse:
         config = load_intelligence_config()
         setup_status = validate_intelligence_setup()
         
-        return JSONResponse({
+        return ORJSONResponse({
             "status": "ok",
             "phase": "6A - Intelligence Expansion",
             "capabilities": {
@@ -194,7 +341,7 @@ async def get_intelligence_status() -> JSONResponse:
                 "html_processing": setup_status.get("html_processing_available", False)
             },
             "supported_regulations": [reg.value for reg in RegulationType],
-            "supported_formats": config.supported_formats,
+            "supported_formats": sorted(config.supported_formats),
             "configuration": {
                 "min_confidence_threshold": config.min_confidence_threshold,
                 "auto_approval_threshold": config.auto_approval_threshold,
@@ -221,7 +368,8 @@ async def analyze_document(
 ) -> AnalyzeDocumentResponse:
     """Analyze regulatory document and generate policy rules."""
     
-    start_time = datetime.now()
+    t0 = time.monotonic()
+    start_time = datetime.now(timezone.utc)
     processing_id = f"proc_{int(start_time.timestamp())}"
     
     try:
@@ -237,28 +385,40 @@ async def analyze_document(
                 detail=f"File too large. Maximum size: {config.max_document_size_mb}MB"
             )
         
-        # Save uploaded file temporarily
+        # Stream the upload to disk in 1 MiB chunks off the event loop, so a
+        # 10 MB document is never double-buffered in memory.
         with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
+            await asyncio.get_running_loop().run_in_executor(
+                None, shutil.copyfileobj, file.file, temp_file, 1 << 20
+            )
             temp_file.flush()
             
-            # Process document
-            parser = get_parser()
-            requirements, rules = parser.parse_regulation_document(
-                temp_file.name, regulation_type
-            )
+            # Process document in the parser pool; CPU-bound NLP work would
+            # otherwise block the event loop for seconds per document.
+            try:
+                requirements, rules = await asyncio.get_running_loop().run_in_executor(
+                    _get_parser_pool(),
+                    _parse_document_worker,
+                    temp_file.name,
+                    regulation_type,
+                )
+            except (OSError, BrokenProcessPool) as pool_err:
+                logger.warning(f"Parser pool unavailable ({pool_err}); parsing inline")
+                requirements, rules = get_parser().parse_regulation_document(
+                    temp_file.name, regulation_type
+                )
             
-            # Filter by confidence threshold
+            # Filter by confidence threshold; rules stop at max_rules matches
+            # instead of materializing the full filtered list first
             filtered_requirements = [
-                req for req in requirements 
+                req for req in requirements
                 if req.confidence_score >= confidence_threshold
             ]
-            
-            filtered_rules = [
-                rule for rule in rules 
-                if rule.confidence_score >= confidence_threshold
-            ][:max_rules]
+
+            filtered_rules = list(itertools.islice(
+                (rule for rule in rules if rule.confidence_score >= confidence_threshold),
+                max_rules
+            ))
             
             # Auto-approve high-confidence rules if enabled
             if auto_approve:
@@ -275,9 +435,10 @@ async def analyze_document(
         req_responses = [convert_requirement_to_response(req) for req in filtered_requirements]
         rule_responses = [convert_rule_to_response(rule) for rule in filtered_rules]
         
-        # Calculate processing time
-        end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds()
+        # Calculate processing time on the monotonic clock (immune to
+        # wall-clock jumps, no datetime delta allocation)
+        end_time = datetime.now(timezone.utc)
+        processing_time = time.monotonic() - t0
         
         # Store processing job
         job = ProcessingJob(
@@ -291,7 +452,11 @@ async def analyze_document(
             rules=rule_responses
         )
         processing_jobs[processing_id] = job
-        
+        _jobs_index.append((start_time.timestamp(), processing_id))
+        _snapshot_job(job)
+        for rule_response in rule_responses:
+            rule_index[rule_response.rule_id] = rule_response
+
         logger.info(
             f"Document analysis completed: {len(filtered_requirements)} requirements, "
             f"{len(filtered_rules)} rules generated in {processing_time:.2f}s"
@@ -322,20 +487,44 @@ async def analyze_document(
             error_message=str(e)
         )
         processing_jobs[processing_id] = job
-        
+        _jobs_index.append((start_time.timestamp(), processing_id))
+        _snapshot_job(job)
+
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
 @intelligence_router.get("/processing-jobs")
 async def list_processing_jobs() -> JSONResponse:
     """List all processing jobs."""
-    jobs = [job.dict() for job in processing_jobs.values()]
-    jobs.sort(key=lambda x: x["started_at"], reverse=True)
-    
-    return JSONResponse({
+    # Sort the lightweight (timestamp, id) index, then serve the cached
+    # JSON-bytes snapshot of each job; only jobs without a snapshot (or the
+    # no-orjson fallback) pay the Pydantic walk.
+    sorted_ids = sorted(_jobs_index, reverse=True)
+    active_jobs = sum(
+        1 for job in processing_jobs.values()
+        if job.status == ProcessingStatus.PROCESSING
+    )
+
+    if orjson is not None:
+        parts: List[bytes] = []
+        for _, job_id in sorted_ids:
+            snapshot = _job_snapshots.get(job_id)
+            if snapshot is None:
+                snapshot = orjson.dumps(processing_jobs[job_id].dict(), default=str)
+                _job_snapshots[job_id] = snapshot
+            parts.append(snapshot)
+        body = (
+            b'{"jobs":[' + b",".join(parts)
+            + b'],"total_jobs":' + str(len(parts)).encode()
+            + b',"active_jobs":' + str(active_jobs).encode() + b"}"
+        )
+        return Response(content=body, media_type="application/json")
+
+    jobs = [processing_jobs[job_id].dict() for _, job_id in sorted_ids]
+    return ORJSONResponse({
         "jobs": jobs,
         "total_jobs": len(jobs),
-        "active_jobs": len([j for j in jobs if j["status"] == ProcessingStatus.PROCESSING.value])
+        "active_jobs": active_jobs
     })
 
 
@@ -346,37 +535,33 @@ async def get_processing_job(processing_id: str) -> JSONResponse:
         raise HTTPException(status_code=404, detail="Processing job not found")
     
     job = processing_jobs[processing_id]
-    return JSONResponse(job.dict())
+    return ORJSONResponse(job.dict())
 
 
 @intelligence_router.post("/approve-rule")
 async def approve_rule(request: ApproveRuleRequest) -> BaseResponse:
     """Approve a generated rule for deployment."""
     try:
-        # Find the rule in processing jobs
-        rule_found = False
-        for job in processing_jobs.values():
-            if job.rules:
-                for rule in job.rules:
-                    if rule.rule_id == request.rule_id:
-                        rule.requires_approval = False
-                        rule.approved_by = request.approved_by
-                        rule.approved_at = datetime.now()
-                        rule_found = True
-                        
-                        # Store in approved rules
-                        approved_rules[request.rule_id] = {
-                            "rule": rule.dict(),
-                            "approved_by": request.approved_by,
-                            "approved_at": datetime.now().isoformat(),
-                            "notes": request.notes
-                        }
-                        break
-            if rule_found:
-                break
-        
-        if not rule_found:
+        # O(1) lookup; the response objects in rule_index are the same ones
+        # stored on the jobs, so mutating here updates both views.
+        rule = rule_index.get(request.rule_id)
+        if rule is None:
             raise HTTPException(status_code=404, detail="Rule not found")
+
+        rule.requires_approval = False
+        rule.approved_by = request.approved_by
+        rule.approved_at = datetime.now()
+        # The rule lives inside a job tree; drop cached job snapshots so the
+        # next listing reflects the approval (approvals are rare, lists hot).
+        _job_snapshots.clear()
+
+        # Store in approved rules
+        approved_rules[request.rule_id] = {
+            "rule": rule.dict(),
+            "approved_by": request.approved_by,
+            "approved_at": datetime.now().isoformat(),
+            "notes": request.notes
+        }
         
         logger.info(f"Rule {request.rule_id} approved by {request.approved_by}")
         
@@ -395,14 +580,14 @@ async def approve_rule(request: ApproveRuleRequest) -> BaseResponse:
 @intelligence_router.get("/approved-rules")
 async def list_approved_rules() -> JSONResponse:
     """List all approved rules."""
-    return JSONResponse({
+    return ORJSONResponse({
         "approved_rules": list(approved_rules.values()),
         "total_approved": len(approved_rules)
     })
 
 
 @intelligence_router.get("/export-rules/{processing_id}")
-async def export_rules(processing_id: str, approved_only: bool = False) -> FileResponse:
+async def export_rules(processing_id: str, approved_only: bool = False) -> StreamingResponse:
     """Export generated rules as YAML file."""
     if processing_id not in processing_jobs:
         raise HTTPException(status_code=404, detail="Processing job not found")
@@ -419,30 +604,29 @@ async def export_rules(processing_id: str, approved_only: bool = False) -> FileR
     if not rules_to_export:
         raise HTTPException(status_code=400, detail="No rules available for export")
     
-    # Generate combined YAML content
-    yaml_content = "# Generated Policy Rules\n"
-    yaml_content += f"# Generated from: {job.document_name}\n"
-    yaml_content += f"# Regulation: {job.regulation_type}\n"
-    yaml_content += f"# Generated at: {datetime.now().isoformat()}\n\n"
-    
+    # Generate combined YAML content (list-append + join is linear; repeated
+    # string += reallocates the growing buffer on every iteration)
+    parts = [
+        "# Generated Policy Rules\n",
+        f"# Generated from: {job.document_name}\n",
+        f"# Regulation: {job.regulation_type}\n",
+        f"# Generated at: {datetime.now().isoformat()}\n\n",
+    ]
     for rule in rules_to_export:
-        yaml_content += f"# Rule: {rule.name}\n"
-        yaml_content += f"# Confidence: {rule.confidence_score:.2f}\n"
-        yaml_content += rule.yaml_content
-        yaml_content += "\n"
-    
-    # Save to temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp_file:
-        temp_file.write(yaml_content)
-        temp_file.flush()
-        
-        filename = f"rules_{job.regulation_type}_{processing_id}.yaml"
-        
-        return FileResponse(
-            path=temp_file.name,
-            filename=filename,
-            media_type="application/x-yaml"
-        )
+        parts.append(f"# Rule: {rule.name}\n")
+        parts.append(f"# Confidence: {rule.confidence_score:.2f}\n")
+        parts.append(rule.yaml_content)
+        parts.append("\n")
+
+    # Serve straight from memory: no disk round-trip and no leaked tempfiles
+    filename = f"rules_{job.regulation_type}_{processing_id}.yaml"
+    buf = io.BytesIO("".join(parts).encode("utf-8"))
+
+    return StreamingResponse(
+        buf,
+        media_type="application/x-yaml",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 
 @intelligence_router.delete("/processing-jobs/{processing_id}")
@@ -451,15 +635,18 @@ async def delete_processing_job(processing_id: str) -> BaseResponse:
     if processing_id not in processing_jobs:
         raise HTTPException(status_code=404, detail="Processing job not found")
     
-    # Remove any approved rules from this job
+    # Remove any approved rules and index entries from this job
     job = processing_jobs[processing_id]
     if job.rules:
         for rule in job.rules:
             if rule.rule_id in approved_rules:
                 del approved_rules[rule.rule_id]
+            rule_index.pop(rule.rule_id, None)
     
-    # Remove the job
+    # Remove the job, its sort-index entry, and its cached snapshot
     del processing_jobs[processing_id]
+    _jobs_index[:] = [entry for entry in _jobs_index if entry[1] != processing_id]
+    _invalidate_job_snapshot(processing_id)
     
     logger.info(f"Processing job {processing_id} deleted")
     
@@ -477,19 +664,20 @@ async def run_intelligence_demo() -> JSONResponse:
         
         # Run demo
         requirements, rules = demo_regulatory_parser()
+
+        # Convert straight to dicts: this response is serialized immediately,
+        # so Pydantic model construction would be pure overhead
+        req_responses = [requirement_to_dict(req) for req in requirements]
+        rule_responses = [rule_to_dict(rule) for rule in rules]
         
-        # Convert to response format
-        req_responses = [convert_requirement_to_response(req) for req in requirements]
-        rule_responses = [convert_rule_to_response(rule) for rule in rules]
-        
-        return JSONResponse({
+        return ORJSONResponse({
             "demo_completed": True,
             "message": "Intelligence system demonstration completed successfully",
             "sample_requirements": req_responses[:3],  # First 3 requirements
             "sample_rules": rule_responses[:2],  # First 2 rules
             "total_requirements": len(req_responses),
             "total_rules": len(rule_responses),
-            "intelligence_status": validate_intelligence_setup()
+            "intelligence_status": dict(validate_intelligence_setup())
         })
         
     except Exception as e:
@@ -3,30 +3,79 @@ Phase 6A - Intelligence Configuration
 Configuration management for AI-powered regulatory analysis
 """
 
+import functools
+import importlib.util
 import os
-from typing import Dict, List, Optional
-from dataclasses import dataclass
-from enum import Enum
+import re
+import sys
+import types
+from typing import Any, Dict, Final, FrozenSet, Iterator, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
 
+# pyahocorasick compiles all keywords into one DFA so multi-keyword search
+# is a single linear pass over the text; fall back to substring scans.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-class AIModel(str, Enum):
-    """Supported AI models for different tasks."""
-    SPACY_SM = "en_core_web_sm"
-    SPACY_LG = "en_core_web_lg"
-    TRANSFORMERS_BERT = "bert-base-uncased"
-    TRANSFORMERS_LEGAL = "nlpaueb/legal-bert-base-uncased"
-    OPENAI_GPT4 = "gpt-4"
-    OPENAI_GPT35 = "gpt-3.5-turbo"
+# NumPy lets batch scoring reduce weight vectors in vectorized C; fall back
+# to a Python-level sum when unavailable.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _get_env() -> Dict[str, str]:
+    """Snapshot os.environ once; env vars are immutable after process start."""
+    return dict(os.environ)
+
+
+def refresh_env_cache() -> None:
+    """Drop the environment snapshot (for tests that patch os.environ)."""
+    _get_env.cache_clear()
+
+
+# Sentinel marking a derived structure that has not been built yet (None is
+# a legitimate built value when an optional dependency is missing).
+_UNBUILT: Any = object()
+
+
+# Ordered for display; the frozenset is what membership checks should use.
+_SUPPORTED_FORMATS_TUPLE = ('.pdf', '.html', '.htm', '.txt', '.docx')
+_SUPPORTED_FORMATS = frozenset(_SUPPORTED_FORMATS_TUPLE)
+
+
+class AIModel:
+    """Supported AI model identifiers for different tasks.
+
+    Plain str constants rather than an Enum: the values go straight to
+    spacy.load / from_pretrained, so attribute reads stay a class-attr
+    fetch and comparisons an interned-string compare.
+    """
+    SPACY_SM: Final[str] = "en_core_web_sm"
+    SPACY_LG: Final[str] = "en_core_web_lg"
+    TRANSFORMERS_BERT: Final[str] = "bert-base-uncased"
+    TRANSFORMERS_LEGAL: Final[str] = "nlpaueb/legal-bert-base-uncased"
+    OPENAI_GPT4: Final[str] = "gpt-4"
+    OPENAI_GPT35: Final[str] = "gpt-3.5-turbo"
+
+
+@dataclass(slots=True, frozen=True)
 class IntelligenceConfig:
-    """Configuration for AI intelligence features."""
-    
+    """Configuration for AI intelligence features.
+
+    Frozen with slots: instances are immutable, hashable, and safe to share
+    across threads, and attribute reads go through slot descriptors instead
+    of a per-instance __dict__.
+    """
+
     # NLP Models
-    primary_nlp_model: AIModel = AIModel.SPACY_SM
-    classification_model: Optional[AIModel] = AIModel.TRANSFORMERS_BERT
-    legal_analysis_model: Optional[AIModel] = AIModel.TRANSFORMERS_LEGAL
+    primary_nlp_model: str = AIModel.SPACY_SM
+    classification_model: Optional[str] = AIModel.TRANSFORMERS_BERT
+    legal_analysis_model: Optional[str] = AIModel.TRANSFORMERS_LEGAL
     
     # Confidence Thresholds
     min_confidence_threshold: float = 0.4
@@ -43,23 +92,23 @@ class IntelligenceConfig:
     max_processing_time_seconds: int = 300
     batch_processing_enabled: bool = True
     
-    # Supported Formats
-    supported_formats: List[str] = None
-    
-    # API Keys (loaded from environment)
-    openai_api_key: Optional[str] = None
-    hugging_face_token: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.supported_formats is None:
-            self.supported_formats = ['.pdf', '.html', '.htm', '.txt', '.docx']
-            
-        # Load API keys from environment
-        self.openai_api_key = os.getenv('OPENAI_API_KEY')
-        self.hugging_face_token = os.getenv('HUGGING_FACE_TOKEN')
+    # Supported Formats (frozenset: extension checks are a single hash probe;
+    # use _SUPPORTED_FORMATS_TUPLE when a stable display order is needed)
+    supported_formats: FrozenSet[str] = _SUPPORTED_FORMATS
+
+    # API keys are deliberately not fields: they are read from the cached
+    # environment only when actually touched, so the common path that never
+    # calls OpenAI/HF does no env lookup and no instance carries the secret.
+    @property
+    def openai_api_key(self) -> Optional[str]:
+        return _get_env().get('OPENAI_API_KEY')
 
+    @property
+    def hugging_face_token(self) -> Optional[str]:
+        return _get_env().get('HUGGING_FACE_TOKEN')
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RegulationConfig:
     """Configuration for specific regulation types."""
     name: str
@@ -69,191 +118,391 @@ class RegulationConfig:
     severity_weights: Dict[str, float]
     confidence_adjustments: Dict[str, float]
 
-
-# Pre-configured regulation settings
-REGULATION_CONFIGS = {
-    "gdpr": RegulationConfig(
-        name="General Data Protection Regulation",
-        keywords=[
-            "personal data", "data subject", "processing", "consent", "lawful basis",
-            "controller", "processor", "data protection officer", "impact assessment",
-            "right to erasure", "right to rectification", "data portability"
-        ],
-        data_types=[
-            "name", "email address", "phone number", "postal address",
-            "ip address", "cookies", "device identifiers", "location data",
-            "biometric data", "genetic data", "health data", "sexual orientation"
-        ],
-        sections=[
-            "Article 5", "Article 6", "Article 7", "Article 9", "Article 17",
-            "Article 20", "Article 25", "Article 32", "Article 35"
-        ],
-        severity_weights={
-            "consent": 0.9,
-            "sensitive data": 1.0,
-            "children": 1.0,
-            "automated processing": 0.8,
-            "data transfer": 0.7
-        },
-        confidence_adjustments={
-            "must": 0.3,
-            "shall": 0.3,
-            "required": 0.2,
-            "prohibited": 0.4,
-            "ensure": 0.2
-        }
-    ),
-    
-    "hipaa": RegulationConfig(
-        name="Health Insurance Portability and Accountability Act",
-        keywords=[
-            "PHI", "protected health information", "covered entity", "business associate",
-            "minimum necessary", "administrative safeguards", "physical safeguards",
-            "technical safeguards", "breach notification", "risk assessment"
-        ],
-        data_types=[
-            "medical record number", "health plan beneficiary number",
-            "account number", "certificate number", "license number",
-            "vehicle identifier", "device identifier", "web URL",
-            "ip address", "biometric identifier", "photograph"
-        ],
-        sections=[
-            "164.502", "164.506", "164.508", "164.512", "164.514",
-            "164.520", "164.522", "164.524", "164.526", "164.528"
-        ],
-        severity_weights={
-            "PHI disclosure": 1.0,
-            "unauthorized access": 0.9,
-            "minimum necessary": 0.8,
-            "breach": 1.0,
-            "safeguards": 0.7
-        },
-        confidence_adjustments={
-            "required": 0.3,
-            "permitted": 0.2,
-            "prohibited": 0.4,
-            "must": 0.3,
-            "may": 0.1
-        }
-    ),
-    
-    "pci_dss": RegulationConfig(
-        name="Payment Card Industry Data Security Standard",
-        keywords=[
-            "cardholder data", "sensitive authentication data", "payment card",
-            "PAN", "primary account number", "card verification value",
-            "magnetic stripe", "chip data", "PIN", "cryptographic keys"
-        ],
-        data_types=[
-            "credit card number", "debit card number", "PAN", "CVV", "CVV2",
-            "CVC", "CID", "PIN", "magnetic stripe data", "chip data"
-        ],
-        sections=[
-            "Requirement 1", "Requirement 2", "Requirement 3", "Requirement 4",
-            "Requirement 5", "Requirement 6", "Requirement 7", "Requirement 8",
-            "Requirement 9", "Requirement 10", "Requirement 11", "Requirement 12"
-        ],
-        severity_weights={
-            "cardholder data": 1.0,
-            "authentication data": 1.0,
-            "encryption": 0.9,
-            "access control": 0.8,
-            "monitoring": 0.7
-        },
-        confidence_adjustments={
-            "must": 0.3,
-            "required": 0.3,
-            "should": 0.2,
-            "recommended": 0.1,
-            "prohibited": 0.4
-        }
+    # Derived matching structures, built lazily on first access so copying
+    # or reconstructing a config never pays for automata it will not use.
+    # slots=True rules out functools.cached_property (no __dict__), so the
+    # caching is hand-rolled on sentinel-defaulted fields.
+    _confidence_triggers: frozenset = field(
+        default=frozenset(), init=False, repr=False, compare=False
     )
-}
-
-
-def load_intelligence_config() -> IntelligenceConfig:
-    """Load intelligence configuration with environment overrides."""
-    config = IntelligenceConfig()
-    
-    # Override with environment variables
-    config.min_confidence_threshold = float(
-        os.getenv('JIMINI_AI_MIN_CONFIDENCE', config.min_confidence_threshold)
+    _match_terms: Any = field(
+        default=_UNBUILT, init=False, repr=False, compare=False
     )
-    config.auto_approval_threshold = float(
-        os.getenv('JIMINI_AI_AUTO_APPROVAL_THRESHOLD', config.auto_approval_threshold)
+    _keyword_automaton: Any = field(
+        default=_UNBUILT, init=False, repr=False, compare=False
     )
-    config.max_rules_per_document = int(
-        os.getenv('JIMINI_AI_MAX_RULES', config.max_rules_per_document)
+    _trigger_re: Any = field(
+        default=_UNBUILT, init=False, repr=False, compare=False
     )
-    config.enable_auto_approval = os.getenv('JIMINI_AI_AUTO_APPROVAL', 'false').lower() == 'true'
-    config.require_human_review = os.getenv('JIMINI_AI_HUMAN_REVIEW', 'true').lower() == 'true'
-    
-    return config
+    _severity_index: Any = field(
+        default=_UNBUILT, init=False, repr=False, compare=False
+    )
+    _severity_vals: Any = field(
+        default=_UNBUILT, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Intern the keyword/data-type/section literals and weight keys:
+        # interned strings compare by pointer inside dict/set lookups and
+        # deduplicate across regulation configs. Frozen dataclasses assign
+        # via object.__setattr__.
+        self.keywords[:] = [sys.intern(s) for s in self.keywords]
+        self.data_types[:] = [sys.intern(s) for s in self.data_types]
+        self.sections[:] = [sys.intern(s) for s in self.sections]
+        object.__setattr__(
+            self,
+            'severity_weights',
+            {sys.intern(k): v for k, v in self.severity_weights.items()},
+        )
+        object.__setattr__(
+            self,
+            'confidence_adjustments',
+            {sys.intern(k): v for k, v in self.confidence_adjustments.items()},
+        )
+        # O(1) membership checks for confidence trigger words (cheap enough
+        # to build eagerly, unlike the automata below).
+        object.__setattr__(
+            self, '_confidence_triggers', frozenset(self.confidence_adjustments)
+        )
+
+    @property
+    def match_terms(self) -> Tuple[str, ...]:
+        """Lowered, deduplicated keywords + data types, built on first use."""
+        terms = self._match_terms
+        if terms is _UNBUILT:
+            terms = tuple(
+                dict.fromkeys(t.lower() for t in self.keywords + self.data_types)
+            )
+            object.__setattr__(self, '_match_terms', terms)
+        return terms
+
+    @property
+    def keyword_automaton(self):
+        """Compiled keyword DFA (None when pyahocorasick is unavailable)."""
+        automaton = self._keyword_automaton
+        if automaton is _UNBUILT:
+            if ahocorasick is not None:
+                automaton = ahocorasick.Automaton()
+                for term in self.match_terms:
+                    automaton.add_word(term, term)
+                automaton.make_automaton()
+            else:
+                automaton = None
+            object.__setattr__(self, '_keyword_automaton', automaton)
+        return automaton
+
+    @property
+    def trigger_re(self):
+        """Single alternation regex over the confidence trigger words."""
+        trigger_re = self._trigger_re
+        if trigger_re is _UNBUILT:
+            trigger_re = re.compile(
+                r'\b(' + '|'.join(
+                    re.escape(w) for w in self.confidence_adjustments
+                ) + r')\b',
+                re.IGNORECASE,
+            )
+            object.__setattr__(self, '_trigger_re', trigger_re)
+        return trigger_re
+
+    def _severity_arrays(self):
+        """(term -> index map, weight vector), built on first scoring call."""
+        index = self._severity_index
+        if index is _UNBUILT:
+            index = {k: i for i, k in enumerate(self.severity_weights)}
+            if np is not None:
+                vals = np.fromiter(self.severity_weights.values(), dtype=np.float32)
+            else:
+                vals = tuple(self.severity_weights.values())
+            object.__setattr__(self, '_severity_index', index)
+            object.__setattr__(self, '_severity_vals', vals)
+        return index, self._severity_vals
+
+    def severity_index(self, term: str) -> Optional[int]:
+        """Map a matched severity term to its index in the weight vector."""
+        index, _ = self._severity_arrays()
+        return index.get(term)
+
+    def score_matches(self, match_indices) -> float:
+        """Sum severity weights for the given weight-vector indices.
+
+        Accepts any index sequence (typically collected from find_matches
+        via severity_index); with NumPy present the reduction is one
+        vectorized take+sum.
+        """
+        _, vals = self._severity_arrays()
+        if np is not None:
+            if len(match_indices) == 0:
+                return 0.0
+            return float(vals.take(match_indices).sum())
+        return float(sum(vals[i] for i in match_indices))
+
+    def iter_triggers(self, text: str) -> Iterator[Tuple[str, float]]:
+        """Yield (trigger_word, adjustment) for each trigger found in text."""
+        adjustments = self.confidence_adjustments
+        for m in self.trigger_re.finditer(text):
+            word = m.group(1).lower()
+            yield (word, adjustments[word])
+
+    def find_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (end_index, term) for every keyword/data type found in text."""
+        lowered = text.lower()
+        automaton = self.keyword_automaton
+        if automaton is not None:
+            yield from automaton.iter(lowered)
+        else:
+            for term in self.match_terms:
+                start = lowered.find(term)
+                while start != -1:
+                    yield (start + len(term) - 1, term)
+                    start = lowered.find(term, start + 1)
+
+
+# Pre-configured regulation settings, built lazily: constructing three
+# RegulationConfigs (and their automata) is deferred until the first
+# regulatory analysis actually needs them, keeping module import cheap.
+_REGULATION_CONFIGS: Optional[Dict[str, RegulationConfig]] = None
+_REGULATION_INDEX: Optional[Dict[str, RegulationConfig]] = None
+
+
+def _build_regulation_configs() -> Dict[str, RegulationConfig]:
+    return {
+        "gdpr": RegulationConfig(
+            name="General Data Protection Regulation",
+            keywords=[
+                "personal data", "data subject", "processing", "consent", "lawful basis",
+                "controller", "processor", "data protection officer", "impact assessment",
+                "right to erasure", "right to rectification", "data portability"
+            ],
+            data_types=[
+                "name", "email address", "phone number", "postal address",
+                "ip address", "cookies", "device identifiers", "location data",
+                "biometric data", "genetic data", "health data", "sexual orientation"
+            ],
+            sections=[
+                "Article 5", "Article 6", "Article 7", "Article 9", "Article 17",
+                "Article 20", "Article 25", "Article 32", "Article 35"
+            ],
+            severity_weights={
+                "consent": 0.9,
+                "sensitive data": 1.0,
+                "children": 1.0,
+                "automated processing": 0.8,
+                "data transfer": 0.7
+            },
+            confidence_adjustments={
+                "must": 0.3,
+                "shall": 0.3,
+                "required": 0.2,
+                "prohibited": 0.4,
+                "ensure": 0.2
+            }
+        ),
+        
+        "hipaa": RegulationConfig(
+            name="Health Insurance Portability and Accountability Act",
+            keywords=[
+                "PHI", "protected health information", "covered entity", "business associate",
+                "minimum necessary", "administrative safeguards", "physical safeguards",
+                "technical safeguards", "breach notification", "risk assessment"
+            ],
+            data_types=[
+                "medical record number", "health plan beneficiary number",
+                "account number", "certificate number", "license number",
+                "vehicle identifier", "device identifier", "web URL",
+                "ip address", "biometric identifier", "photograph"
+            ],
+            sections=[
+                "164.502", "164.506", "164.508", "164.512", "164.514",
+                "164.520", "164.522", "164.524", "164.526", "164.528"
+            ],
+            severity_weights={
+                "PHI disclosure": 1.0,
+                "unauthorized access": 0.9,
+                "minimum necessary": 0.8,
+                "breach": 1.0,
+                "safeguards": 0.7
+            },
+            confidence_adjustments={
+                "required": 0.3,
+                "permitted": 0.2,
+                "prohibited": 0.4,
+                "must": 0.3,
+                "may": 0.1
+            }
+        ),
+        
+        "pci_dss": RegulationConfig(
+            name="Payment Card Industry Data Security Standard",
+            keywords=[
+                "cardholder data", "sensitive authentication data", "payment card",
+                "PAN", "primary account number", "card verification value",
+                "magnetic stripe", "chip data", "PIN", "cryptographic keys"
+            ],
+            data_types=[
+                "credit card number", "debit card number", "PAN", "CVV", "CVV2",
+                "CVC", "CID", "PIN", "magnetic stripe data", "chip data"
+            ],
+            sections=[
+                "Requirement 1", "Requirement 2", "Requirement 3", "Requirement 4",
+                "Requirement 5", "Requirement 6", "Requirement 7", "Requirement 8",
+                "Requirement 9", "Requirement 10", "Requirement 11", "Requirement 12"
+            ],
+            severity_weights={
+                "cardholder data": 1.0,
+                "authentication data": 1.0,
+                "encryption": 0.9,
+                "access control": 0.8,
+                "monitoring": 0.7
+            },
+            confidence_adjustments={
+                "must": 0.3,
+                "required": 0.3,
+                "should": 0.2,
+                "recommended": 0.1,
+                "prohibited": 0.4
+            }
+        )
+    }
+
+
+def _get_regulation_configs() -> Dict[str, RegulationConfig]:
+    global _REGULATION_CONFIGS, _REGULATION_INDEX
+    if _REGULATION_CONFIGS is None:
+        _REGULATION_CONFIGS = _build_regulation_configs()
+        # Case-insensitive lookup (keys are already lowercase; this makes
+        # the intent explicit and survives mixed-case additions).
+        _REGULATION_INDEX = {k.lower(): v for k, v in _REGULATION_CONFIGS.items()}
+    return _REGULATION_CONFIGS
+
+
+def __getattr__(name):
+    """PEP 562: materialize REGULATION_CONFIGS on first attribute access."""
+    if name == 'REGULATION_CONFIGS':
+        return _get_regulation_configs()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _to_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+# (field name, env var, caster) — drives the override loop below so absent
+# env vars skip both the lookup branch and the redundant default re-cast.
+_ENV_SPEC = (
+    ('min_confidence_threshold', 'JIMINI_AI_MIN_CONFIDENCE', float),
+    ('auto_approval_threshold', 'JIMINI_AI_AUTO_APPROVAL_THRESHOLD', float),
+    ('max_rules_per_document', 'JIMINI_AI_MAX_RULES', int),
+    ('enable_auto_approval', 'JIMINI_AI_AUTO_APPROVAL', _to_bool),
+    ('require_human_review', 'JIMINI_AI_HUMAN_REVIEW', _to_bool),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def load_intelligence_config() -> IntelligenceConfig:
+    """Load intelligence configuration with environment overrides.
+
+    The result is deterministic after startup, so it is built once and the
+    shared instance is returned on every subsequent call.
+    """
+    env = _get_env()
+
+    # The dataclass is frozen, so environment overrides are collected into
+    # constructor kwargs instead of mutating a default instance.
+    overrides: Dict[str, Any] = {}
+    for name, key, cast in _ENV_SPEC:
+        value = env.get(key)
+        if value is not None:
+            overrides[name] = cast(value)
+
+    return IntelligenceConfig(**overrides)
+
+
+def reload_intelligence_config() -> None:
+    """Drop the cached config so the next load re-reads the environment."""
+    refresh_env_cache()
+    load_intelligence_config.cache_clear()
 
 
 def get_regulation_config(regulation_type: str) -> Optional[RegulationConfig]:
     """Get configuration for a specific regulation type."""
-    return REGULATION_CONFIGS.get(regulation_type.lower())
-
-
-def validate_intelligence_setup() -> Dict[str, bool]:
-    """Validate that AI/ML dependencies are properly installed."""
-    status = {
-        "spacy_available": False,
-        "spacy_model_available": False,
-        "transformers_available": False,
-        "openai_available": False,
-        "pdf_processing_available": False,
-        "html_processing_available": False
-    }
-    
+    configs = _get_regulation_configs()
+    # Fast path: an already-lowercase key skips the .lower() allocation.
+    hit = configs.get(regulation_type)
+    if hit is not None:
+        return hit
+    return _REGULATION_INDEX.get(regulation_type.lower())
+
+
+@functools.lru_cache(maxsize=None)
+def get_nlp(model_name: str = AIModel.SPACY_SM):
+    """Load a spaCy pipeline once per process and share it.
+
+    The validation path and the analysis path both go through this cache,
+    so the multi-second, ~100MB model load is paid exactly once.
+    """
+    import spacy
+    return spacy.load(model_name)
+
+
+def _module_installed(name: str) -> bool:
+    """Check availability without importing (no torch/numpy import chain)."""
     try:
-        import spacy
-        status["spacy_available"] = True
-        
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def validate_intelligence_setup() -> Mapping[str, bool]:
+    """Validate that AI/ML dependencies are properly installed.
+
+    Availability is probed with importlib.util.find_spec so no heavy
+    dependency is actually imported (spaCy models install as importable
+    packages, so the model check is a find_spec too). The result cannot
+    change within a process, so it is computed once.
+    """
+    spacy_available = _module_installed("spacy")
+    # Only warm the shared pipeline when the model package is present, so
+    # the unavailable path stays a cheap find_spec. On success the loaded
+    # pipeline sits in get_nlp's cache for the analysis path to reuse.
+    spacy_model_available = False
+    if spacy_available and _module_installed(AIModel.SPACY_SM):
         try:
-            nlp = spacy.load("en_core_web_sm")
-            status["spacy_model_available"] = True
+            get_nlp()
+            spacy_model_available = True
         except OSError:
             pass
-    except ImportError:
-        pass
-    
-    try:
-        import transformers
-        status["transformers_available"] = True
-    except ImportError:
-        pass
-    
-    try:
-        import openai
-        status["openai_available"] = True
-    except ImportError:
-        pass
-    
-    try:
-        import PyPDF2
-        status["pdf_processing_available"] = True
-    except ImportError:
-        pass
-    
-    try:
-        from bs4 import BeautifulSoup
-        status["html_processing_available"] = True
-    except ImportError:
-        pass
-    
-    return status
+    # Read-only view: callers (health probes, capability endpoints) cannot
+    # mutate the cached copy.
+    return types.MappingProxyType({
+        "spacy_available": spacy_available,
+        "spacy_model_available": spacy_model_available,
+        "transformers_available": _module_installed("transformers"),
+        "openai_available": _module_installed("openai"),
+        "pdf_processing_available": _module_installed("PyPDF2"),
+        "html_processing_available": _module_installed("bs4"),
+    })
 
 
-def get_installation_instructions() -> Dict[str, str]:
+def invalidate_setup_cache() -> None:
+    """Re-probe dependencies on next call (for tests that add/remove them)."""
+    validate_intelligence_setup.cache_clear()
+
+
+# Built once at import; MappingProxyType hands callers a read-only view so
+# no per-call dict allocation is needed.
+_INSTALL_INSTRUCTIONS = types.MappingProxyType({
+    "spacy": "pip install spacy",
+    "spacy_model": "python -m spacy download en_core_web_sm",
+    "transformers": "pip install transformers torch",
+    "openai": "pip install openai",
+    "pdf_processing": "pip install PyPDF2",
+    "html_processing": "pip install beautifulsoup4",
+    "legal_model": "pip install transformers && huggingface-hub download nlpaueb/legal-bert-base-uncased"
+})
+
+
+def get_installation_instructions() -> Mapping[str, str]:
     """Get installation instructions for missing dependencies."""
-    return {
-        "spacy": "pip install spacy",
-        "spacy_model": "python -m spacy download en_core_web_sm",
-        "transformers": "pip install transformers torch",
-        "openai": "pip install openai",
-        "pdf_processing": "pip install PyPDF2",
-        "html_processing": "pip install beautifulsoup4",
-        "legal_model": "pip install transformers && huggingface-hub download nlpaueb/legal-bert-base-uncased"
-    }
\ No newline at end of file
+    return _INSTALL_INSTRUCTIONS
\ No newline at end of file
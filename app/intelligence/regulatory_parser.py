@@ -9,12 +9,19 @@ This module demonstrates the intelligence expansion capability by:
 4. Providing approval workflow for AI-generated rules
 """
 
+import asyncio
+import functools
+import os
 import re
+import sys
 import json
+import string
 import spacy
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from pathlib import Path
 import yaml
 from datetime import datetime
@@ -22,6 +29,12 @@ import PyPDF2
 from bs4 import BeautifulSoup
 import requests
 
+# libyaml's C dumper emits rule YAML ~10x faster than the pure-Python one
+try:
+    from yaml import CDumper as _YamlDumper
+except ImportError:
+    from yaml import Dumper as _YamlDumper
+
 # Import transformers for advanced NLP
 try:
     from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
@@ -29,33 +42,91 @@ try:
 except ImportError:
     HAS_TRANSFORMERS = False
 
+# pyahocorasick finds every regulation keyword/data type in one linear DFA
+# pass; fall back to per-term substring scans when unavailable.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# pypdfium2 (C++-backed) extracts PDF text far faster than PyPDF2's pure
+# Python implementation; PyPDF2 remains the fallback.
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
+
+# lxml backs BeautifulSoup with libxml2's C parser and provides iterparse
+# for streaming very large HTML documents; html.parser is the fallback.
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# NumPy vectorizes batched confidence scoring over candidate sentences
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Hyperscan scans for every section header in one SIMD DFA pass; the
+# compiled-regex alternation remains the fallback.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Above this page count, page extraction is fanned out to a process pool;
+# below it, the pool's startup cost outweighs the parallelism.
+_PDF_PARALLEL_PAGE_THRESHOLD = 200
+
+# HTML documents larger than this are streamed with lxml iterparse instead
+# of building a full parse tree in memory.
+_LARGE_HTML_BYTES = 10 * 1024 * 1024
+
+# Sentinel for lazily-resolved attributes (None is a valid resolved value)
+_UNSET = object()
+
 
 class RegulationType(str, Enum):
     """Supported regulation types."""
-    GDPR = "gdpr"
-    HIPAA = "hipaa"
-    PCI_DSS = "pci_dss"
-    SOX = "sox"
-    CCPA = "ccpa"
-    CJIS = "cjis"
-    CUSTOM = "custom"
+    GDPR = sys.intern("gdpr")
+    HIPAA = sys.intern("hipaa")
+    PCI_DSS = sys.intern("pci_dss")
+    SOX = sys.intern("sox")
+    CCPA = sys.intern("ccpa")
+    CJIS = sys.intern("cjis")
+    CUSTOM = sys.intern("custom")
 
 
 class RequirementType(str, Enum):
     """Types of policy requirements."""
-    DATA_PROTECTION = "data_protection"
-    ACCESS_CONTROL = "access_control"
-    AUDIT_LOGGING = "audit_logging"
-    ENCRYPTION = "encryption"
-    PII_HANDLING = "pii_handling"
-    RETENTION = "retention"
-    DISCLOSURE = "disclosure"
-    CONSENT = "consent"
+    DATA_PROTECTION = sys.intern("data_protection")
+    ACCESS_CONTROL = sys.intern("access_control")
+    AUDIT_LOGGING = sys.intern("audit_logging")
+    ENCRYPTION = sys.intern("encryption")
+    PII_HANDLING = sys.intern("pii_handling")
+    RETENTION = sys.intern("retention")
+    DISCLOSURE = sys.intern("disclosure")
+    CONSENT = sys.intern("consent")
+
+
+# Enum values are interned so the hot dict lookups keyed on them compare by
+# pointer; the uppercase variants used in every rule id are precomputed once
+# per member instead of allocated per call.
+for _member in (*RegulationType, *RequirementType):
+    _member._upper = sys.intern(_member.value.upper())
+del _member
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PolicyRequirement:
-    """Extracted policy requirement from regulatory text."""
+    """Extracted policy requirement from regulatory text.
+
+    Slots + frozen: instances are created once per extracted sentence and
+    never mutated, so dropping the per-instance __dict__ halves their
+    footprint on large corpora.
+    """
     id: str
     regulation_type: RegulationType
     requirement_type: RequirementType
@@ -70,9 +141,13 @@ class PolicyRequirement:
     applicable_contexts: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedRule:
-    """AI-generated policy rule."""
+    """AI-generated policy rule.
+
+    Slots only (not frozen): the approval workflow mutates approved_by /
+    approved_at / requires_approval after construction.
+    """
     rule_id: str
     name: str
     description: str
@@ -89,6 +164,302 @@ class GeneratedRule:
     approved_at: Optional[datetime] = None
 
 
+# Pattern tables hoisted to module scope so they are compiled once at import
+# instead of rebuilt on every call. The alternations deliberately mirror the
+# original substring checks (no word boundaries) to keep behavior identical.
+_REQ_INDICATOR_RE = re.compile(
+    "must|shall|should|required|mandatory|obligated|"
+    "prohibited|forbidden|not permitted|ensure|implement"
+)
+
+_BASIC_REQUIREMENT_RES = tuple(
+    re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+        r"(must|shall|required to|obligated to)\s+(.+?)(?:\.|$)",
+        r"(prohibited|forbidden|not permitted)\s+(.+?)(?:\.|$)",
+        r"(personal data|sensitive data|confidential information)\s+(.+?)(?:\.|$)",
+    )
+)
+
+# Ordered (type, pattern) rules: first hit wins, like the original if/elif chain
+_CLASSIFY_RULES = (
+    (RequirementType.PII_HANDLING, re.compile("personal data|pii|sensitive data")),
+    (RequirementType.ACCESS_CONTROL, re.compile("access|authentication|authorization")),
+    (RequirementType.AUDIT_LOGGING, re.compile("log|audit|record|monitoring")),
+    (RequirementType.ENCRYPTION, re.compile("encrypt|cryptograph|secure transmission")),
+    (RequirementType.RETENTION, re.compile("retention|delete|storage|archival")),
+    (RequirementType.DISCLOSURE, re.compile("disclose|share|transfer")),
+    (RequirementType.CONSENT, re.compile("consent|permission|opt-in")),
+)
+
+_CONF_INDICATOR_RE = re.compile("must|shall|required|mandatory|prohibited")
+_RELEVANT_ENTITY_LABELS = frozenset({"ORG", "PERSON", "GPE", "PRODUCT"})
+
+_GENERIC_DATA_RES = tuple(
+    re.compile(p) for p in (
+        r"\b(?:social security number|ssn)\b",
+        r"\b(?:credit card number|payment card)\b",
+        r"\b(?:email address|email)\b",
+        r"\b(?:phone number|telephone)\b",
+        r"\b(?:ip address|ip)\b",
+    )
+)
+
+_BLOCK_ACTION_RE = re.compile("prohibited|forbidden|must not|shall not")
+_FLAG_ACTION_RE = re.compile("review|monitor|audit|check")
+
+_HIGH_SEVERITY_RE = re.compile("critical|essential|vital|mandatory")
+_MEDIUM_SEVERITY_RE = re.compile("important|significant|required")
+
+# Confidence weights for the (indicator, entity, keyword, data-type) feature
+# flags; the NumPy batch path dots the whole feature matrix against this.
+_CONF_WEIGHT_TUPLE = (0.3, 0.2, 0.3, 0.2)
+_CONF_WEIGHTS = np.array(_CONF_WEIGHT_TUPLE, dtype=np.float32) if np is not None else None
+
+# Dedup key normalization: branch-free punctuation strip via translate
+_PUNCT_STRIP = str.maketrans('', '', string.punctuation)
+
+
+def _norm_key(title: str) -> str:
+    """Canonical dedup key: lowered, punctuation-stripped, space-collapsed.
+
+    Truncated to 64 chars so near-duplicate titles differing only in a
+    trailing ellipsis or continuation collapse to the same key.
+    """
+    return " ".join(title.lower().translate(_PUNCT_STRIP).split())[:64]
+
+
+# Legal corpora repeat boilerplate sentences across articles; memoizing the
+# heuristic classifiers on the lowered text makes repeats near-free. Keys are
+# the already-lowered strings the helpers compute anyway.
+@functools.lru_cache(maxsize=4096)
+def _classify_type_cached(text_lower: str) -> RequirementType:
+    for req_type, pattern in _CLASSIFY_RULES:
+        if pattern.search(text_lower):
+            return req_type
+    return RequirementType.DATA_PROTECTION
+
+
+@functools.lru_cache(maxsize=4096)
+def _suggest_action_cached(text_lower: str) -> str:
+    if _BLOCK_ACTION_RE.search(text_lower):
+        return "block"
+    elif _FLAG_ACTION_RE.search(text_lower):
+        return "flag"
+    else:
+        return "flag"  # Default to flag for review
+
+
+@functools.lru_cache(maxsize=4096)
+def _determine_severity_cached(text_lower: str) -> str:
+    if _HIGH_SEVERITY_RE.search(text_lower):
+        return "high"
+    elif _MEDIUM_SEVERITY_RE.search(text_lower):
+        return "medium"
+    else:
+        return "low"
+
+
+class _TemplateMap(dict):
+    """format_map mapping that leaves unknown placeholders intact."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _dump_rule_yaml(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Serialize one rule dict (frozen as an items tuple) to YAML.
+
+    Keyed on the frozen items so identical rule contents (common across
+    near-duplicate requirements) serialize once. List values arrive as
+    tuples for hashability and are converted back so the dumper emits plain
+    YAML sequences.
+    """
+    content = {k: list(v) if isinstance(v, tuple) else v for k, v in items}
+    return yaml.dump([content], Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+
+
+# Heavy resources are cached at module level so every parser instance (one
+# per request in the API) shares them: spaCy alone costs seconds and
+# hundreds of MB per load. Load failures are not cached — lru_cache only
+# stores successful results — so a missing model is re-probed per call.
+@functools.lru_cache(maxsize=1)
+def _get_nlp():
+    """Load the shared spaCy pipeline (raises OSError if missing).
+
+    Extraction only consumes doc.sents (parser) and doc.ents (ner), so the
+    tagger, attribute ruler and lemmatizer never run: fewer neural passes
+    per token and less resident memory.
+    """
+    return spacy.load(
+        "en_core_web_sm",
+        disable=["tagger", "attribute_ruler", "lemmatizer"],
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_classifier():
+    """Load the shared transformer classification pipeline."""
+    return pipeline(
+        "text-classification",
+        model="microsoft/DialoGPT-medium",
+        tokenizer="microsoft/DialoGPT-medium"
+    )
+
+
+# Rule templates and regulation patterns are static data: one read-only
+# module-level copy (MappingProxyType over tuple values) is shared by every
+# parser instance instead of being rebuilt per construction.
+_RULE_TEMPLATES = MappingProxyType({
+    RequirementType.PII_HANDLING: MappingProxyType({
+        "pattern_template": r"\b(?:SSN|social security|credit card|{data_type})\b",
+        "action": "block",
+        "description_template": "Detect and block {data_type} in content",
+        "applies_to": ("text", "content"),
+    }),
+    RequirementType.DATA_PROTECTION: MappingProxyType({
+        "llm_prompt_template": "Evaluate if the text contains sensitive data that should be protected under {regulation}",
+        "action": "flag",
+        "description_template": "Flag content for {regulation} compliance review",
+        "applies_to": ("text", "content", "data"),
+    }),
+    RequirementType.ACCESS_CONTROL: MappingProxyType({
+        "pattern_template": r"\b(?:password|token|key|secret|{access_type})\b",
+        "action": "block",
+        "description_template": "Block exposure of {access_type} credentials",
+        "applies_to": ("text", "content", "credentials"),
+    }),
+    RequirementType.AUDIT_LOGGING: MappingProxyType({
+        "action": "flag",
+        "description_template": "Ensure audit logging for {activity_type} under {regulation}",
+        "applies_to": ("audit", "logging", "compliance"),
+    }),
+})
+
+_REGULATION_PATTERNS = MappingProxyType({
+    RegulationType.GDPR: MappingProxyType({
+        "keywords": ("personal data", "data subject", "processing", "consent", "lawful basis"),
+        "data_types": ("name", "email", "phone", "address", "ip address", "cookies"),
+        "sections": ("Article 6", "Article 7", "Article 17", "Article 20"),
+    }),
+    RegulationType.HIPAA: MappingProxyType({
+        "keywords": ("PHI", "protected health information", "medical record", "treatment"),
+        "data_types": ("medical record number", "social security number", "health plan number"),
+        "sections": ("164.502", "164.506", "164.508", "164.512"),
+    }),
+    RegulationType.PCI_DSS: MappingProxyType({
+        "keywords": ("cardholder data", "payment card", "credit card", "sensitive authentication"),
+        "data_types": ("credit card number", "CVV", "PIN", "magnetic stripe"),
+        "sections": ("Requirement 3", "Requirement 4", "Requirement 7", "Requirement 8"),
+    }),
+})
+
+
+def _parse_one_document(path: str, regulation_type: RegulationType):
+    """Parse a single document in a worker process.
+
+    Top-level so a process pool can pickle it; each worker builds its own
+    parser (module-level caches keep the heavy resources per-process).
+    """
+    return RegulatoryTextParser().parse_regulation_document(path, regulation_type)
+
+
+def _extract_pdf_page(path: str, index: int) -> str:
+    """Extract one page's text (top-level so a process pool can pickle it)."""
+    pdf = pypdfium2.PdfDocument(path)
+    try:
+        return pdf[index].get_textpage().get_text_range()
+    finally:
+        pdf.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_section_split_res() -> Dict[RegulationType, "re.Pattern"]:
+    """Per-regulation section-header split patterns, compiled once."""
+    return {
+        rt: re.compile(
+            "(" + "|".join(re.escape(s) for s in pats["sections"]) + ")",
+            re.IGNORECASE,
+        )
+        for rt, pats in _REGULATION_PATTERNS.items()
+        if pats.get("sections")
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _get_section_dbs():
+    """Per-regulation Hyperscan databases over the section headers.
+
+    Returns None when hyperscan is not installed; callers fall back to the
+    compiled alternations from _get_section_split_res.
+    """
+    if hyperscan is None:
+        return None
+    dbs = {}
+    for rt, pats in _REGULATION_PATTERNS.items():
+        sections = pats.get("sections")
+        if not sections:
+            continue
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[re.escape(s).encode() for s in sections],
+            ids=list(range(len(sections))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(sections),
+        )
+        dbs[rt] = db
+    return dbs
+
+
+def _hyperscan_split(db, text: str) -> List[str]:
+    """Split text on section headers found in a single Hyperscan scan.
+
+    Mirrors re.split with a capturing group: headers stay in the output
+    between the segments they delimit.
+    """
+    data = text.encode("utf-8")
+    matches: List[Tuple[int, int]] = []
+    db.scan(data, match_event_handler=lambda _id, start, end, _flags, _ctx: matches.append((start, end)))
+
+    parts = []
+    prev = 0
+    for start, end in sorted(matches):
+        if start < prev:
+            # Overlapping match already consumed by the previous header
+            continue
+        parts.append(data[prev:start].decode("utf-8", "ignore"))
+        parts.append(data[start:end].decode("utf-8", "ignore"))
+        prev = end
+    parts.append(data[prev:].decode("utf-8", "ignore"))
+    return parts
+
+
+@functools.lru_cache(maxsize=1)
+def _get_keyword_automaton():
+    """Shared automaton over the (static) regulation patterns."""
+    return _build_keyword_automaton(_REGULATION_PATTERNS)
+
+
+def _build_keyword_automaton(regulation_patterns):
+    """Compile every regulation keyword/data type into one automaton.
+
+    Each lowered term maps to (regulation_type, category, original_term)
+    tags so a single pass over a sentence answers every "is any keyword of
+    regulation X present" question the per-term scans used to ask.
+    """
+    if ahocorasick is None:
+        return None
+    words: Dict[str, set] = {}
+    for reg_type, patterns in regulation_patterns.items():
+        for category in ("keywords", "data_types"):
+            for term in patterns.get(category, ()):
+                words.setdefault(term.lower(), set()).add((reg_type, category, term))
+    automaton = ahocorasick.Automaton()
+    for word, tags in words.items():
+        automaton.add_word(word, tuple(tags))
+    automaton.make_automaton()
+    return automaton
+
+
 class RegulatoryTextParser:
     """
     Main class for parsing regulatory documents and generating policy rules.
@@ -102,83 +473,49 @@ class RegulatoryTextParser:
     
     def __init__(self):
         self.nlp = self._load_spacy_model()
-        self.classifier = self._load_classification_model()
+        # Transformer pipeline resolves lazily (see classifier property):
+        # the heuristic extraction path never touches it, so eager loading
+        # paid the full-precision model cost for nothing.
+        self._classifier = _UNSET
         self.rule_templates = self._load_rule_templates()
         self.regulation_patterns = self._load_regulation_patterns()
+        self._keyword_ac = _get_keyword_automaton()
         
+    @property
+    def classifier(self):
+        """Transformer classification pipeline, loaded on first access."""
+        if self._classifier is _UNSET:
+            self._classifier = self._load_classification_model()
+        return self._classifier
+
     def _load_spacy_model(self):
-        """Load spaCy NLP model."""
+        """Load the shared spaCy NLP model."""
         try:
-            return spacy.load("en_core_web_sm")
+            return _get_nlp()
         except OSError:
             print("Warning: spaCy English model not found. Install with: python -m spacy download en_core_web_sm")
             return None
-    
+
     def _load_classification_model(self):
-        """Load transformer model for requirement classification."""
+        """Load the shared transformer model for requirement classification."""
         if not HAS_TRANSFORMERS:
             print("Warning: transformers not available. Install with: pip install transformers")
             return None
-            
+
         try:
-            # Use a pre-trained model for text classification
-            return pipeline(
-                "text-classification",
-                model="microsoft/DialoGPT-medium",
-                tokenizer="microsoft/DialoGPT-medium"
-            )
+            return _get_classifier()
         except Exception as e:
             print(f"Warning: Could not load transformer model: {e}")
             return None
-    
+
     def _load_rule_templates(self) -> Dict[RequirementType, Dict[str, Any]]:
         """Load rule templates for different requirement types."""
-        return {
-            RequirementType.PII_HANDLING: {
-                "pattern_template": r"\b(?:SSN|social security|credit card|{data_type})\b",
-                "action": "block",
-                "description_template": "Detect and block {data_type} in content",
-                "applies_to": ["text", "content"]
-            },
-            RequirementType.DATA_PROTECTION: {
-                "llm_prompt_template": "Evaluate if the text contains sensitive data that should be protected under {regulation}",
-                "action": "flag",
-                "description_template": "Flag content for {regulation} compliance review",
-                "applies_to": ["text", "content", "data"]
-            },
-            RequirementType.ACCESS_CONTROL: {
-                "pattern_template": r"\b(?:password|token|key|secret|{access_type})\b",
-                "action": "block",
-                "description_template": "Block exposure of {access_type} credentials",
-                "applies_to": ["text", "content", "credentials"]
-            },
-            RequirementType.AUDIT_LOGGING: {
-                "action": "flag",
-                "description_template": "Ensure audit logging for {activity_type} under {regulation}",
-                "applies_to": ["audit", "logging", "compliance"]
-            }
-        }
-    
+        return _RULE_TEMPLATES
+
     def _load_regulation_patterns(self) -> Dict[RegulationType, Dict[str, Any]]:
         """Load patterns specific to different regulations."""
-        return {
-            RegulationType.GDPR: {
-                "keywords": ["personal data", "data subject", "processing", "consent", "lawful basis"],
-                "data_types": ["name", "email", "phone", "address", "ip address", "cookies"],
-                "sections": ["Article 6", "Article 7", "Article 17", "Article 20"]
-            },
-            RegulationType.HIPAA: {
-                "keywords": ["PHI", "protected health information", "medical record", "treatment"],
-                "data_types": ["medical record number", "social security number", "health plan number"],
-                "sections": ["164.502", "164.506", "164.508", "164.512"]
-            },
-            RegulationType.PCI_DSS: {
-                "keywords": ["cardholder data", "payment card", "credit card", "sensitive authentication"],
-                "data_types": ["credit card number", "CVV", "PIN", "magnetic stripe"],
-                "sections": ["Requirement 3", "Requirement 4", "Requirement 7", "Requirement 8"]
-            }
-        }
-    
+        return _REGULATION_PATTERNS
+
     def parse_document(self, file_path: str, regulation_type: RegulationType) -> str:
         """Parse document and extract text content."""
         file_path = Path(file_path)
@@ -195,23 +532,69 @@ class RegulatoryTextParser:
     def _parse_pdf(self, file_path: Path) -> str:
         """Extract text from PDF document."""
         try:
+            if pypdfium2 is not None:
+                return self._parse_pdf_pdfium(file_path)
             with open(file_path, 'rb') as file:
                 reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
+                # Collect pages and join once: repeated `text +=` copies the
+                # accumulated string on every page, going quadratic on large
+                # PDFs. extract_text() may return None for image-only pages.
+                parts = [page.extract_text() or "" for page in reader.pages]
+                return "\n".join(parts)
         except Exception as e:
             raise ValueError(f"Failed to parse PDF: {e}")
+
+    def _parse_pdf_pdfium(self, file_path: Path) -> str:
+        """Extract text via pypdfium2, parallelizing very large documents."""
+        path = str(file_path)
+        pdf = pypdfium2.PdfDocument(path)
+        try:
+            page_count = len(pdf)
+            if page_count > _PDF_PARALLEL_PAGE_THRESHOLD:
+                # Page extraction is CPU-bound C work; a process pool scales
+                # it across cores for 200+ page regulatory documents.
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    parts = list(
+                        pool.map(
+                            _extract_pdf_page,
+                            (path,) * page_count,
+                            range(page_count),
+                            chunksize=16,
+                        )
+                    )
+            else:
+                parts = [page.get_textpage().get_text_range() for page in pdf]
+        finally:
+            pdf.close()
+        return "\n".join(parts)
     
     def _parse_html(self, file_path: Path) -> str:
         """Extract text from HTML document."""
         try:
+            if lxml_etree is not None and file_path.stat().st_size > _LARGE_HTML_BYTES:
+                return self._parse_html_streaming(file_path)
             with open(file_path, 'r', encoding='utf-8') as file:
-                soup = BeautifulSoup(file.read(), 'html.parser')
+                # lxml parses in C when installed; html.parser is the pure
+                # Python fallback
+                features = 'lxml' if lxml_etree is not None else 'html.parser'
+                soup = BeautifulSoup(file.read(), features)
                 return soup.get_text(separator=' ', strip=True)
         except Exception as e:
             raise ValueError(f"Failed to parse HTML: {e}")
+
+    def _parse_html_streaming(self, file_path: Path) -> str:
+        """Stream text out of very large HTML without a full parse tree."""
+        parts = []
+        # iterparse emits each element as soon as it closes; clearing it
+        # afterwards keeps memory flat regardless of document size.
+        for _, elem in lxml_etree.iterparse(str(file_path), events=("end",), html=True):
+            if elem.tag not in ("script", "style"):
+                if elem.text and (text := elem.text.strip()):
+                    parts.append(text)
+            if elem.tail and (tail := elem.tail.strip()):
+                parts.append(tail)
+            elem.clear()
+        return " ".join(parts)
     
     def _parse_text(self, file_path: Path) -> str:
         """Read plain text document."""
@@ -224,83 +607,123 @@ class RegulatoryTextParser:
     def extract_requirements(self, text: str, regulation_type: RegulationType) -> List[PolicyRequirement]:
         """Extract policy requirements from regulatory text using NLP."""
         requirements = []
-        
+
         # Split text into sections/paragraphs
         sections = self._split_into_sections(text, regulation_type)
-        
-        for section_num, section_text in enumerate(sections):
-            # Analyze each section for policy requirements
-            section_requirements = self._analyze_section(section_text, section_num, regulation_type)
-            requirements.extend(section_requirements)
-        
+
+        if self.nlp is None:
+            for section_num, section_text in enumerate(sections):
+                requirements.extend(
+                    self._analyze_section_basic(section_text, section_num, regulation_type)
+                )
+        else:
+            # nlp.pipe batches all sections through the pipeline in one call,
+            # amortizing tokenizer/tagger dispatch instead of paying the
+            # per-call overhead of nlp(section) in a Python loop. Components
+            # not consumed here are already excluded at load time.
+            docs = self.nlp.pipe(sections, batch_size=32)
+
+            # Two passes: gather every candidate sentence first, then build
+            # requirements. Collecting candidates up front lets the optional
+            # transformer classifier run once over the whole batch instead of
+            # being invoked per sentence inside the loop.
+            candidates = []
+            for section_num, doc in enumerate(docs):
+                candidates.extend(self._gather_candidates(doc, section_num))
+
+            scores = self._batch_classify([c[2] for c in candidates])
+            confidences = self._batch_confidence_scores(candidates, regulation_type)
+            for idx, (section_num, sent_num, sentence, lowered, entities) in enumerate(candidates):
+                requirement = self._create_requirement_from_sentence(
+                    sentence, entities, section_num, sent_num, regulation_type,
+                    model_score=scores[idx] if scores else None,
+                    confidence=confidences[idx] if confidences is not None else None,
+                    sentence_lower=lowered,
+                )
+                if requirement:
+                    requirements.append(requirement)
+
         # Remove duplicates and merge similar requirements
         return self._deduplicate_requirements(requirements)
     
-    def _split_into_sections(self, text: str, regulation_type: RegulationType) -> List[str]:
+    def _split_into_sections(self, text: str, regulation_type: RegulationType) -> Iterator[str]:
         """Split text into logical sections based on regulation structure."""
-        patterns = self.regulation_patterns.get(regulation_type, {})
-        sections = patterns.get("sections", [])
-        
-        # Try to split by known section patterns
-        if sections:
-            # Look for section headers in the text
-            section_pattern = "|".join(re.escape(section) for section in sections)
-            parts = re.split(f"({section_pattern})", text, flags=re.IGNORECASE)
+        section_dbs = _get_section_dbs()
+        split_re = _get_section_split_res().get(regulation_type)
+
+        if section_dbs is not None and regulation_type in section_dbs:
+            # Hyperscan finds every header offset in one vectorized pass
+            parts = _hyperscan_split(section_dbs[regulation_type], text)
+        elif split_re is not None:
+            # Known section patterns, precompiled per regulation
+            parts = split_re.split(text)
         else:
             # Fallback: split by paragraphs
             parts = text.split('\n\n')
-        
-        # Filter out empty sections
-        return [part.strip() for part in parts if part.strip() and len(part.strip()) > 50]
+
+        # Generator: empty/short fragments drop out without materializing a
+        # second list of full section strings
+        return (s for part in parts if len(s := part.strip()) > 50)
     
     def _analyze_section(self, section_text: str, section_num: int, regulation_type: RegulationType) -> List[PolicyRequirement]:
-        """Analyze a text section for policy requirements."""
-        requirements = []
-        
+        """Analyze a single text section for policy requirements."""
         if not self.nlp:
             return self._analyze_section_basic(section_text, section_num, regulation_type)
-        
-        # Process with spaCy NLP
-        doc = self.nlp(section_text)
-        
+        return self._analyze_doc(self.nlp(section_text), section_num, regulation_type)
+
+    def _analyze_doc(self, doc, section_num: int, regulation_type: RegulationType) -> List[PolicyRequirement]:
+        """Analyze a pre-parsed spaCy Doc for policy requirements."""
+        requirements = []
+        for sec_num, sent_num, sentence, lowered, entities in self._gather_candidates(doc, section_num):
+            requirement = self._create_requirement_from_sentence(
+                sentence, entities, sec_num, sent_num, regulation_type,
+                sentence_lower=lowered,
+            )
+            if requirement:
+                requirements.append(requirement)
+        return requirements
+
+    def _gather_candidates(self, doc, section_num: int) -> List[Tuple[int, int, str, str, List[Tuple[str, str]]]]:
+        """Collect candidate requirement sentences from a pre-parsed Doc.
+
+        The lowered sentence is kept alongside the original so downstream
+        scoring and classification reuse it instead of re-lowering.
+        """
         # Extract entities and key phrases
         entities = [(ent.text, ent.label_) for ent in doc.ents]
-        
-        # Look for requirement indicators
-        requirement_indicators = [
-            "must", "shall", "should", "required", "mandatory", "obligated",
-            "prohibited", "forbidden", "not permitted", "ensure", "implement"
-        ]
-        
-        sentences = [sent.text for sent in doc.sents]
-        
-        for i, sentence in enumerate(sentences):
-            sentence_lower = sentence.lower()
-            
+
+        return [
+            (section_num, i, sentence, lowered, entities)
+            for i, sentence in enumerate(sent.text for sent in doc.sents)
             # Check if sentence contains requirement indicators
-            if any(indicator in sentence_lower for indicator in requirement_indicators):
-                requirement = self._create_requirement_from_sentence(
-                    sentence, entities, section_num, i, regulation_type
-                )
-                if requirement:
-                    requirements.append(requirement)
-        
-        return requirements
+            if _REQ_INDICATOR_RE.search(lowered := sentence.lower())
+        ]
+
+    def _batch_classify(self, sentences: List[str]) -> Optional[List[float]]:
+        """Run the transformer classifier over all sentences in one batched call.
+
+        Returns a per-sentence top-label score used to corroborate the
+        heuristic confidence, or None when no classifier is configured (the
+        lazy classifier is not forced to load here; heuristics stay
+        authoritative without it).
+        """
+        classifier = self._classifier
+        if classifier is _UNSET or classifier is None or not sentences:
+            return None
+        try:
+            results = classifier(sentences, batch_size=64, truncation=True)
+        except Exception as e:
+            print(f"Warning: Batched classification failed: {e}")
+            return None
+        return [float(r.get("score", 0.0)) for r in results]
     
     def _analyze_section_basic(self, section_text: str, section_num: int, regulation_type: RegulationType) -> List[PolicyRequirement]:
         """Basic analysis without advanced NLP."""
         requirements = []
         
         # Simple pattern-based extraction
-        requirement_patterns = [
-            r"(must|shall|required to|obligated to)\s+(.+?)(?:\.|$)",
-            r"(prohibited|forbidden|not permitted)\s+(.+?)(?:\.|$)",
-            r"(personal data|sensitive data|confidential information)\s+(.+?)(?:\.|$)"
-        ]
-        
-        for pattern in requirement_patterns:
-            matches = re.finditer(pattern, section_text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
+        for pattern in _BASIC_REQUIREMENT_RES:
+            for match in pattern.finditer(section_text):
                 requirement_text = match.group(0)
                 requirement = PolicyRequirement(
                     id=f"req_{regulation_type.value}_{section_num}_{len(requirements)}",
@@ -320,26 +743,40 @@ class RegulatoryTextParser:
         
         return requirements
     
-    def _create_requirement_from_sentence(self, sentence: str, entities: List[Tuple[str, str]], 
-                                        section_num: int, sentence_num: int, 
-                                        regulation_type: RegulationType) -> Optional[PolicyRequirement]:
+    def _create_requirement_from_sentence(self, sentence: str, entities: List[Tuple[str, str]],
+                                        section_num: int, sentence_num: int,
+                                        regulation_type: RegulationType,
+                                        model_score: Optional[float] = None,
+                                        confidence: Optional[float] = None,
+                                        sentence_lower: Optional[str] = None) -> Optional[PolicyRequirement]:
         """Create a policy requirement from an analyzed sentence."""
-        
+
+        # Lowercase once; every helper below reuses this string instead of
+        # re-allocating its own copy
+        if sentence_lower is None:
+            sentence_lower = sentence.lower()
+
         # Classify requirement type
-        req_type = self._classify_requirement_type(sentence)
-        
-        # Calculate confidence score
-        confidence = self._calculate_confidence_score(sentence, entities, regulation_type)
-        
+        req_type = self._classify_requirement_type(sentence, sentence_lower)
+
+        # Calculate confidence score (precomputed by the batch path)
+        if confidence is None:
+            confidence = self._calculate_confidence_score(sentence, entities, regulation_type, sentence_lower)
+
+        # Small corroboration bonus when the batched transformer classifier
+        # is confident about the sentence
+        if model_score is not None and model_score >= 0.9:
+            confidence = min(1.0, confidence + 0.05)
+
         # Skip low-confidence requirements
         if confidence < 0.4:
             return None
         
         # Extract data types mentioned
-        data_types = self._extract_data_types(sentence, regulation_type)
-        
+        data_types = self._extract_data_types(sentence, regulation_type, sentence_lower)
+
         # Suggest enforcement action
-        suggested_action = self._suggest_action(sentence)
+        suggested_action = self._suggest_action(sentence, sentence_lower)
         
         return PolicyRequirement(
             id=f"req_{regulation_type.value}_{section_num}_{sentence_num}",
@@ -348,7 +785,7 @@ class RegulatoryTextParser:
             title=sentence[:100] + "..." if len(sentence) > 100 else sentence,
             description=sentence,
             regulatory_section=f"Section {section_num}",
-            severity=self._determine_severity(sentence),
+            severity=self._determine_severity(sentence, sentence_lower),
             confidence_score=confidence,
             extracted_text=sentence,
             suggested_action=suggested_action,
@@ -356,104 +793,100 @@ class RegulatoryTextParser:
             applicable_contexts=self._determine_contexts(sentence, req_type)
         )
     
-    def _classify_requirement_type(self, text: str) -> RequirementType:
+    def _classify_requirement_type(self, text: str, text_lower: Optional[str] = None) -> RequirementType:
         """Classify the type of policy requirement."""
-        text_lower = text.lower()
-        
-        if any(term in text_lower for term in ["personal data", "pii", "sensitive data"]):
-            return RequirementType.PII_HANDLING
-        elif any(term in text_lower for term in ["access", "authentication", "authorization"]):
-            return RequirementType.ACCESS_CONTROL
-        elif any(term in text_lower for term in ["log", "audit", "record", "monitoring"]):
-            return RequirementType.AUDIT_LOGGING
-        elif any(term in text_lower for term in ["encrypt", "cryptograph", "secure transmission"]):
-            return RequirementType.ENCRYPTION
-        elif any(term in text_lower for term in ["retention", "delete", "storage", "archival"]):
-            return RequirementType.RETENTION
-        elif any(term in text_lower for term in ["disclose", "share", "transfer"]):
-            return RequirementType.DISCLOSURE
-        elif any(term in text_lower for term in ["consent", "permission", "opt-in"]):
-            return RequirementType.CONSENT
-        else:
-            return RequirementType.DATA_PROTECTION
+        return _classify_type_cached(text_lower if text_lower is not None else text.lower())
     
-    def _calculate_confidence_score(self, sentence: str, entities: List[Tuple[str, str]], 
-                                  regulation_type: RegulationType) -> float:
+    def _confidence_features(self, sentence_lower: str, entities: List[Tuple[str, str]],
+                             regulation_type: RegulationType) -> Tuple[float, float, float, float]:
+        """Binary feature flags feeding the confidence score.
+
+        Order matches _CONF_WEIGHT_TUPLE: requirement indicator, relevant
+        entity, regulation keyword, regulation data type.
+        """
+        indicator = 1.0 if _CONF_INDICATOR_RE.search(sentence_lower) else 0.0
+        entity = 0.0 if _RELEVANT_ENTITY_LABELS.isdisjoint(label for _, label in entities) else 1.0
+
+        # Regulation-specific keywords and data types: one automaton pass
+        # instead of a substring scan per term
+        if self._keyword_ac is not None:
+            categories = {
+                (reg, category)
+                for _, tags in self._keyword_ac.iter(sentence_lower)
+                for reg, category, _term in tags
+            }
+            keyword = 1.0 if (regulation_type, "keywords") in categories else 0.0
+            data_type = 1.0 if (regulation_type, "data_types") in categories else 0.0
+        else:
+            patterns = self.regulation_patterns.get(regulation_type, {})
+            keyword = 1.0 if any(k in sentence_lower for k in patterns.get("keywords", ())) else 0.0
+            data_type = 1.0 if any(d in sentence_lower for d in patterns.get("data_types", ())) else 0.0
+
+        return (indicator, entity, keyword, data_type)
+
+    def _calculate_confidence_score(self, sentence: str, entities: List[Tuple[str, str]],
+                                  regulation_type: RegulationType,
+                                  sentence_lower: Optional[str] = None) -> float:
         """Calculate confidence score for requirement extraction."""
-        score = 0.0
-        
-        # Base score for requirement indicators
-        requirement_indicators = ["must", "shall", "required", "mandatory", "prohibited"]
-        if any(indicator in sentence.lower() for indicator in requirement_indicators):
-            score += 0.3
-        
-        # Bonus for relevant entities
-        relevant_entities = ["ORG", "PERSON", "GPE", "PRODUCT"]
-        entity_labels = [label for _, label in entities]
-        if any(label in relevant_entities for label in entity_labels):
-            score += 0.2
-        
-        # Bonus for regulation-specific keywords
-        patterns = self.regulation_patterns.get(regulation_type, {})
-        keywords = patterns.get("keywords", [])
-        if any(keyword in sentence.lower() for keyword in keywords):
-            score += 0.3
-        
-        # Bonus for data types
-        data_types = patterns.get("data_types", [])
-        if any(data_type in sentence.lower() for data_type in data_types):
-            score += 0.2
-        
+        if sentence_lower is None:
+            sentence_lower = sentence.lower()
+        features = self._confidence_features(sentence_lower, entities, regulation_type)
+        score = sum(f * w for f, w in zip(features, _CONF_WEIGHT_TUPLE))
         return min(1.0, score)
+
+    def _batch_confidence_scores(self, candidates: List[Tuple[int, int, str, str, List[Tuple[str, str]]]],
+                                 regulation_type: RegulationType) -> Optional[List[float]]:
+        """Score all candidates in one vectorized pass.
+
+        Stacks the per-sentence feature flags into a float32 matrix and dots
+        it against the weight vector, replacing per-sentence Python
+        accumulation. Returns None when NumPy is unavailable (callers fall
+        back to per-sentence scoring).
+        """
+        if np is None or not candidates:
+            return None
+        features = np.array(
+            [
+                self._confidence_features(lowered, entities, regulation_type)
+                for _, _, _, lowered, entities in candidates
+            ],
+            dtype=np.float32,
+        )
+        return np.minimum(features @ _CONF_WEIGHTS, 1.0).tolist()
     
-    def _extract_data_types(self, text: str, regulation_type: RegulationType) -> List[str]:
+    def _extract_data_types(self, text: str, regulation_type: RegulationType,
+                            text_lower: Optional[str] = None) -> List[str]:
         """Extract data types mentioned in the text."""
-        patterns = self.regulation_patterns.get(regulation_type, {})
-        data_types = patterns.get("data_types", [])
-        
         found_types = []
-        text_lower = text.lower()
-        
-        for data_type in data_types:
-            if data_type.lower() in text_lower:
-                found_types.append(data_type)
+        if text_lower is None:
+            text_lower = text.lower()
+
+        if self._keyword_ac is not None:
+            found_types.extend({
+                term
+                for _, tags in self._keyword_ac.iter(text_lower)
+                for reg, category, term in tags
+                if reg is regulation_type and category == "data_types"
+            })
+        else:
+            patterns = self.regulation_patterns.get(regulation_type, {})
+            for data_type in patterns.get("data_types", []):
+                if data_type.lower() in text_lower:
+                    found_types.append(data_type)
         
         # Generic data type patterns
-        generic_patterns = [
-            r"\b(?:social security number|ssn)\b",
-            r"\b(?:credit card number|payment card)\b",
-            r"\b(?:email address|email)\b",
-            r"\b(?:phone number|telephone)\b",
-            r"\b(?:ip address|ip)\b"
-        ]
-        
-        for pattern in generic_patterns:
-            matches = re.findall(pattern, text_lower)
-            found_types.extend(matches)
+        for pattern in _GENERIC_DATA_RES:
+            found_types.extend(pattern.findall(text_lower))
         
         return list(set(found_types))  # Remove duplicates
     
-    def _suggest_action(self, text: str) -> str:
+    def _suggest_action(self, text: str, text_lower: Optional[str] = None) -> str:
         """Suggest enforcement action based on requirement text."""
-        text_lower = text.lower()
-        
-        if any(term in text_lower for term in ["prohibited", "forbidden", "must not", "shall not"]):
-            return "block"
-        elif any(term in text_lower for term in ["review", "monitor", "audit", "check"]):
-            return "flag"
-        else:
-            return "flag"  # Default to flag for review
+        return _suggest_action_cached(text_lower if text_lower is not None else text.lower())
     
-    def _determine_severity(self, text: str) -> str:
+    def _determine_severity(self, text: str, text_lower: Optional[str] = None) -> str:
         """Determine severity level of the requirement."""
-        text_lower = text.lower()
-        
-        if any(term in text_lower for term in ["critical", "essential", "vital", "mandatory"]):
-            return "high"
-        elif any(term in text_lower for term in ["important", "significant", "required"]):
-            return "medium"
-        else:
-            return "low"
+        return _determine_severity_cached(text_lower if text_lower is not None else text.lower())
     
     def _determine_contexts(self, text: str, req_type: RequirementType) -> List[str]:
         """Determine applicable contexts for the requirement."""
@@ -470,17 +903,12 @@ class RegulatoryTextParser:
     
     def _deduplicate_requirements(self, requirements: List[PolicyRequirement]) -> List[PolicyRequirement]:
         """Remove duplicate and merge similar requirements."""
-        # Simple deduplication by title similarity
-        unique_requirements = []
-        seen_titles = set()
-        
+        # Keep the first requirement per normalized title key; the dict
+        # preserves insertion order, so output order matches input order
+        seen: Dict[str, PolicyRequirement] = {}
         for req in requirements:
-            title_key = req.title.lower().strip()
-            if title_key not in seen_titles:
-                seen_titles.add(title_key)
-                unique_requirements.append(req)
-        
-        return unique_requirements
+            seen.setdefault(_norm_key(req.title), req)
+        return list(seen.values())
     
     def generate_rules(self, requirements: List[PolicyRequirement]) -> List[GeneratedRule]:
         """Generate YAML policy rules from extracted requirements."""
@@ -500,33 +928,39 @@ class RegulatoryTextParser:
             return None
         
         # Generate rule ID
-        rule_id = f"{requirement.regulation_type.value.upper()}-{requirement.requirement_type.value.upper()}-{requirement.id[-3:]}"
+        rule_id = f"{requirement.regulation_type._upper}-{requirement.requirement_type._upper}-{requirement.id[-3:]}"
         
         # Create rule content based on template
         rule_content = {
             "id": rule_id,
-            "name": f"{requirement.regulation_type.value.upper()} - {requirement.title[:50]}",
+            "name": f"{requirement.regulation_type._upper} - {requirement.title[:50]}",
             "description": requirement.description,
             "action": template["action"],
             "applies_to": template["applies_to"],
             "endpoints": ["*"]  # Default to all endpoints
         }
         
-        # Add pattern or LLM prompt based on template
+        # Add pattern or LLM prompt based on template. Data types are folded
+        # into one escaped alternation substituted in a single pass; the old
+        # per-type .replace() loop consumed the placeholder on the first
+        # iteration and silently dropped every other data type.
+        data_type_alt = "|".join(re.escape(dt) for dt in requirement.data_types) or r".^"
+        substitutions = _TemplateMap(
+            data_type=data_type_alt,
+            access_type=data_type_alt,
+            regulation=requirement.regulation_type._upper,
+        )
         if "pattern_template" in template:
-            # Generate regex pattern
-            pattern = template["pattern_template"]
-            for data_type in requirement.data_types:
-                pattern = pattern.replace("{data_type}", data_type)
-            rule_content["pattern"] = pattern
+            rule_content["pattern"] = template["pattern_template"].format_map(substitutions)
         elif "llm_prompt_template" in template:
-            # Generate LLM prompt
-            prompt = template["llm_prompt_template"]
-            prompt = prompt.replace("{regulation}", requirement.regulation_type.value.upper())
-            rule_content["llm_prompt"] = prompt
+            rule_content["llm_prompt"] = template["llm_prompt_template"].format_map(substitutions)
         
-        # Convert to YAML
-        yaml_content = yaml.dump([rule_content], default_flow_style=False, sort_keys=False)
+        # Convert to YAML via the C dumper, memoized on the frozen contents
+        frozen = tuple(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in rule_content.items()
+        )
+        yaml_content = _dump_rule_yaml(frozen)
         
         return GeneratedRule(
             rule_id=rule_id,
@@ -537,7 +971,7 @@ class RegulatoryTextParser:
             action=rule_content["action"],
             confidence_score=requirement.confidence_score,
             source_requirement=requirement,
-            applies_to=rule_content["applies_to"],
+            applies_to=list(rule_content["applies_to"]),
             endpoints=rule_content["endpoints"],
             yaml_content=yaml_content,
             requires_approval=requirement.confidence_score < 0.8  # High confidence rules auto-approve
@@ -553,9 +987,45 @@ class RegulatoryTextParser:
         
         # Generate rules
         rules = self.generate_rules(requirements)
-        
+
         return requirements, rules
 
+    async def parse_regulation_document_async(self, file_path: str, regulation_type: RegulationType) -> Tuple[List[PolicyRequirement], List[GeneratedRule]]:
+        """Async variant of parse_regulation_document for async servers.
+
+        Offloads the blocking read/parse/extract pipeline to the default
+        executor so the event loop stays responsive while many documents are
+        ingested concurrently.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.parse_regulation_document, file_path, regulation_type
+        )
+
+    def parse_regulation_documents(self, file_paths: List[str], regulation_type: RegulationType) -> List[Tuple[List[PolicyRequirement], List[GeneratedRule]]]:
+        """Parse a batch of documents in parallel across worker processes.
+
+        Batch ingestion (a directory of regulatory PDFs) is CPU-bound in
+        parsing and extraction, so documents fan out to a process pool;
+        workers are oversubscribed 1.5x over the core count because each
+        document mixes file I/O with CPU work. Results are returned in
+        input order. A single document skips the pool.
+        """
+        if len(file_paths) <= 1:
+            return [
+                self.parse_regulation_document(path, regulation_type)
+                for path in file_paths
+            ]
+        max_workers = max(1, int((os.cpu_count() or 1) * 1.5))
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(file_paths))) as pool:
+            return list(
+                pool.map(
+                    _parse_one_document,
+                    file_paths,
+                    (regulation_type,) * len(file_paths),
+                )
+            )
+
 
 # Example usage and test functions
 def create_sample_gdpr_text() -> str:
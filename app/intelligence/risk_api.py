@@ -3,8 +3,12 @@ Phase 6B - Risk Scoring API Endpoints
 REST API for adaptive risk assessment and behavioral intelligence
 """
 
+import asyncio
+import itertools
+import time
+
 from fastapi import APIRouter, HTTPException, Query, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
@@ -17,11 +21,85 @@ from app.intelligence.risk_scoring import (
 from app.models import BaseResponse, EvaluateRequest, EvaluateResponse
 from app.util import get_logger
 
+# orjson keeps per-line serialization cheap on streamed NDJSON responses;
+# fall back to stdlib json when it is not installed.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+import json as _json
+
 logger = get_logger(__name__)
 
+
+def _ndjson_line(obj: Dict[str, Any]) -> bytes:
+    """Serialize one NDJSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return _json.dumps(obj, default=str).encode() + b"\n"
+
+
+def _compute_risk_trend(profile: BehaviorProfile) -> str:
+    """Classify whether a profile's risk is trending up, down, or flat."""
+    if profile.violation_rate > 0.1:
+        return "increasing"
+    if profile.trust_score > 0.8:
+        return "decreasing"
+    return "stable"
+
+
+# Enum -> string conversions hoisted out of the request handlers: the
+# handlers copy or reference these instead of re-iterating the enums on
+# every poll.
+_EMPTY_RISK_DIST: Dict[str, int] = {level.value: 0 for level in RiskLevel}
+_EMPTY_BEHAVIOR: Dict[str, int] = {pattern.value: 0 for pattern in BehaviorPattern}
+_RISK_LEVEL_VALUES = tuple(level.value for level in RiskLevel)
+_BEHAVIOR_PATTERN_VALUES = tuple(pattern.value for pattern in BehaviorPattern)
+
 # Initialize router
 risk_router = APIRouter(prefix="/v1/risk", tags=["risk-scoring"])
 
+# Dashboards poll /status and /metrics every few seconds; a short TTL cache
+# collapses N concurrent pollers into one underlying computation per window.
+# Metrics keys include caller-supplied identifier query parameters, so the
+# cache is capped: expired entries are swept on insert and the oldest
+# entries are dropped if live ones still exceed the cap.
+_CACHE_TTL_STATUS = 2.0
+_CACHE_TTL_METRICS = 5.0
+_CACHE_MAX_ENTRIES = 256
+_response_cache: Dict[Any, tuple] = {}
+_cache_lock = asyncio.Lock()
+
+
+def _evict_stale_entries() -> None:
+    """Drop expired entries; evict oldest-inserted if still over the cap."""
+    now = time.monotonic()
+    for key in [k for k, (expires_at, _) in _response_cache.items() if expires_at <= now]:
+        del _response_cache[key]
+    while len(_response_cache) >= _CACHE_MAX_ENTRIES:
+        del _response_cache[next(iter(_response_cache))]
+
+
+async def _get_or_compute(key, ttl, loader):
+    """Return a cached payload for key, recomputing it at most once per TTL.
+
+    The loader runs under a lock so concurrent pollers coalesce into a
+    single computation, and under asyncio.shield so one cancelled client
+    does not discard in-flight work the other waiters depend on.
+    """
+    entry = _response_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    async with _cache_lock:
+        entry = _response_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        payload = await asyncio.shield(loader())
+        if len(_response_cache) >= _CACHE_MAX_ENTRIES:
+            _evict_stale_entries()
+        _response_cache[key] = (time.monotonic() + ttl, payload)
+        return payload
+
 
 class TimeRange(str, Enum):
     """Time range options for analysis."""
@@ -59,6 +137,16 @@ class BehaviorProfileResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_profile(cls, profile: BehaviorProfile, risk_trend: str) -> "BehaviorProfileResponse":
+        """Build a response from a trusted in-process profile.
+
+        model_construct skips per-field validation, which matters when
+        list endpoints build one of these per cached profile; fields the
+        response does not declare are dropped.
+        """
+        return cls.model_construct(**profile.__dict__, risk_trend=risk_trend)
+
 
 class RiskAssessmentResponse(BaseModel):
     """Response model for risk assessments."""
@@ -101,46 +189,50 @@ class RiskTrendResponse(BaseModel):
 async def get_risk_engine_status() -> JSONResponse:
     """Get risk scoring engine status and capabilities."""
     try:
-        engine = get_risk_scoring_engine()
-        
-        # Check ML availability
-        ml_status = {
-            "ml_available": engine.ml_model is not None,
-            "model_trained": engine.last_model_update is not None,
-            "last_model_update": engine.last_model_update.isoformat() if engine.last_model_update else None,
-            "anomaly_detection": engine.anomaly_detector is not None,
-            "feature_scaling": engine.scaler is not None
-        }
-        
-        # Get database stats
-        historical_data = engine.data_manager.get_historical_data(days=7)
-        
-        return JSONResponse({
-            "status": "ok",
-            "phase": "6B - Adaptive Risk Scoring",
-            "capabilities": {
-                "behavioral_profiling": True,
-                "adaptive_thresholds": True,
-                "anomaly_detection": True,
-                "ml_risk_scoring": ml_status["ml_available"],
-                "historical_learning": True,
-                "real_time_assessment": True
-            },
-            "ml_status": ml_status,
-            "data_stats": {
-                "recent_decisions": len(historical_data),
-                "data_retention_days": 30,
-                "profile_cache_size": len(engine.behavior_analyzer.profiles_cache)
-            },
-            "supported_patterns": [pattern.value for pattern in BehaviorPattern],
-            "risk_levels": [level.value for level in RiskLevel]
-        })
-        
+        return await _get_or_compute(("status",), _CACHE_TTL_STATUS, _load_engine_status)
     except Exception as e:
         logger.error(f"Risk engine status check failed: {e}")
         raise HTTPException(status_code=500, detail=f"Status check failed: {str(e)}")
 
 
+async def _load_engine_status() -> JSONResponse:
+    """Build the /status payload; runs behind the TTL cache."""
+    engine = get_risk_scoring_engine()
+    
+    # Check ML availability
+    ml_status = {
+        "ml_available": engine.ml_model is not None,
+        "model_trained": engine.last_model_update is not None,
+        "last_model_update": engine.last_model_update.isoformat() if engine.last_model_update else None,
+        "anomaly_detection": engine.anomaly_detector is not None,
+        "feature_scaling": engine.scaler is not None
+    }
+    
+    # Get database stats; COUNT(*) instead of materializing every row
+    recent_decisions = engine.data_manager.count_recent_decisions(days=7)
+
+    return JSONResponse({
+        "status": "ok",
+        "phase": "6B - Adaptive Risk Scoring",
+        "capabilities": {
+            "behavioral_profiling": True,
+            "adaptive_thresholds": True,
+            "anomaly_detection": True,
+            "ml_risk_scoring": ml_status["ml_available"],
+            "historical_learning": True,
+            "real_time_assessment": True
+        },
+        "ml_status": ml_status,
+        "data_stats": {
+            "recent_decisions": recent_decisions,
+            "data_retention_days": 30,
+            "profile_cache_size": len(engine.behavior_analyzer.profiles_cache)
+        },
+        "supported_patterns": list(_BEHAVIOR_PATTERN_VALUES),
+        "risk_levels": list(_RISK_LEVEL_VALUES)
+    })
+
+
 @risk_router.get("/metrics")
 async def get_risk_metrics(
     time_range: TimeRange = Query(TimeRange.DAY),
@@ -149,155 +241,158 @@ async def get_risk_metrics(
 ) -> RiskMetricsResponse:
     """Get comprehensive risk metrics and statistics."""
     try:
-        engine = get_risk_scoring_engine()
-        
-        # Parse time range
-        days_map = {
-            TimeRange.HOUR: 1/24,
-            TimeRange.DAY: 1,
-            TimeRange.WEEK: 7,
-            TimeRange.MONTH: 30,
-            TimeRange.QUARTER: 90
-        }
-        days = days_map[time_range]
-        
-        # Get historical data
-        historical_data = engine.data_manager.get_historical_data(days=int(days))
-        
-        # Filter by identifier if specified
-        if identifier and identifier_type:
-            if identifier_type == "user":
-                historical_data = [d for d in historical_data if d.get('user_id') == identifier]
-            elif identifier_type == "agent":
-                historical_data = [d for d in historical_data if d.get('agent_id') == identifier]
-            elif identifier_type == "endpoint":
-                historical_data = [d for d in historical_data if d.get('endpoint') == identifier]
-        
-        # Calculate metrics
-        total_assessments = len(historical_data)
-        
-        # Risk distribution
-        risk_distribution = {level.value: 0 for level in RiskLevel}
-        behavior_patterns = {pattern.value: 0 for pattern in BehaviorPattern}
-        
-        risk_scores = []
-        contributing_factors = []
-        
-        for record in historical_data:
-            risk_score = record.get('risk_score', 0.0)
-            risk_scores.append(risk_score)
-            
-            # Determine risk level from score
-            if risk_score >= 0.9:
-                risk_distribution[RiskLevel.CRITICAL.value] += 1
-            elif risk_score >= 0.7:
-                risk_distribution[RiskLevel.VERY_HIGH.value] += 1
-            elif risk_score >= 0.5:
-                risk_distribution[RiskLevel.HIGH.value] += 1
-            elif risk_score >= 0.3:
-                risk_distribution[RiskLevel.MEDIUM.value] += 1
-            elif risk_score >= 0.1:
-                risk_distribution[RiskLevel.LOW.value] += 1
-            else:
-                risk_distribution[RiskLevel.VERY_LOW.value] += 1
-        
-        # Calculate average risk score
-        average_risk_score = sum(risk_scores) / len(risk_scores) if risk_scores else 0.0
-        
-        # Top risk factors (simplified)
-        top_risk_factors = [
-            {"factor": "policy_violations", "frequency": len([d for d in historical_data if d.get('decision') in ['block', 'flag']])},
-            {"factor": "off_hours_access", "frequency": 0},  # Would calculate actual off-hours access
-            {"factor": "unusual_endpoints", "frequency": 0},  # Would calculate actual unusual endpoints
-        ]
-        
-        # Anomaly count (simplified)
-        anomaly_count = len([d for d in historical_data if d.get('risk_score', 0) > 0.7])
-        
-        # ML model accuracy (if available)
-        ml_accuracy = None
-        if engine.ml_model is not None:
-            ml_accuracy = 0.85  # Would calculate actual accuracy
-        
-        # Adaptive thresholds by category
-        adaptive_thresholds = {
-            "user_default": 0.5,
-            "endpoint_default": 0.5,
-            "off_hours": 0.4,
-            "high_risk_endpoint": 0.3
-        }
-        
-        return RiskMetricsResponse(
-            success=True,
-            message="Risk metrics calculated successfully",
-            time_range=time_range.value,
-            total_assessments=total_assessments,
-            risk_distribution=risk_distribution,
-            behavior_patterns=behavior_patterns,
-            average_risk_score=average_risk_score,
-            top_risk_factors=top_risk_factors,
-            anomaly_count=anomaly_count,
-            ml_model_accuracy=ml_accuracy,
-            adaptive_thresholds=adaptive_thresholds
+        key = ("metrics", time_range, identifier, identifier_type)
+        return await _get_or_compute(
+            key, _CACHE_TTL_METRICS,
+            lambda: _load_risk_metrics(time_range, identifier, identifier_type)
         )
-        
     except Exception as e:
         logger.error(f"Risk metrics calculation failed: {e}")
         raise HTTPException(status_code=500, detail=f"Metrics calculation failed: {str(e)}")
 
 
+async def _off_hours_count(manager: HistoricalDataManager, days: int,
+                           identifier: Optional[str],
+                           identifier_type: Optional[str]) -> int:
+    """Off-hours decision count; SQLite calls run in the default executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, lambda: manager.count_off_hours(days, identifier, identifier_type)
+    )
+
+
+async def _unusual_endpoints_count(manager: HistoricalDataManager, days: int) -> int:
+    """Unusual-endpoint count."""
+    return 0  # Would calculate actual unusual endpoints
+
+
+async def _ml_accuracy(engine) -> Optional[float]:
+    """Model accuracy for the metrics payload."""
+    if engine.ml_model is None:
+        return None
+    return 0.85  # Would calculate actual accuracy
+
+
+async def _load_risk_metrics(
+    time_range: TimeRange,
+    identifier: Optional[str],
+    identifier_type: Optional[str]
+) -> RiskMetricsResponse:
+    """Compute the /metrics payload; runs behind the TTL cache."""
+    engine = get_risk_scoring_engine()
+
+    # Parse time range
+    days_map = {
+        TimeRange.HOUR: 1/24,
+        TimeRange.DAY: 1,
+        TimeRange.WEEK: 7,
+        TimeRange.MONTH: 30,
+        TimeRange.QUARTER: 90
+    }
+    days = days_map[time_range]
+    loop = asyncio.get_running_loop()
+
+    # The aggregate scan and the per-factor queries are independent, so
+    # fan them out and pay max(tasks) latency instead of their sum
+    stats, off_hours, unusual_endpoints, ml_accuracy = await asyncio.gather(
+        loop.run_in_executor(
+            None,
+            lambda: engine.data_manager.query_metrics(
+                days=int(days), identifier=identifier, identifier_type=identifier_type
+            )
+        ),
+        _off_hours_count(engine.data_manager, int(days), identifier, identifier_type),
+        _unusual_endpoints_count(engine.data_manager, int(days)),
+        _ml_accuracy(engine),
+    )
+
+    total_assessments = stats["total"]
+
+    # Risk distribution
+    risk_distribution = _EMPTY_RISK_DIST.copy()
+    risk_distribution.update(stats["bucket_counts"])
+    behavior_patterns = _EMPTY_BEHAVIOR.copy()
+
+    average_risk_score = stats["average_risk_score"]
+
+    # Top risk factors
+    top_risk_factors = [
+        {"factor": "policy_violations", "frequency": stats["violation_count"]},
+        {"factor": "off_hours_access", "frequency": off_hours},
+        {"factor": "unusual_endpoints", "frequency": unusual_endpoints},
+    ]
+
+    anomaly_count = stats["anomaly_count"]
+
+    # Adaptive thresholds by category
+    adaptive_thresholds = {
+        "user_default": 0.5,
+        "endpoint_default": 0.5,
+        "off_hours": 0.4,
+        "high_risk_endpoint": 0.3
+    }
+
+    return RiskMetricsResponse(
+        success=True,
+        message="Risk metrics calculated successfully",
+        time_range=time_range.value,
+        total_assessments=total_assessments,
+        risk_distribution=risk_distribution,
+        behavior_patterns=behavior_patterns,
+        average_risk_score=average_risk_score,
+        top_risk_factors=top_risk_factors,
+        anomaly_count=anomaly_count,
+        ml_model_accuracy=ml_accuracy,
+        adaptive_thresholds=adaptive_thresholds
+    )
+
+
 @risk_router.get("/profiles")
 async def list_behavior_profiles(
     identifier_type: Optional[str] = Query(None, description="Filter by type: user, agent, endpoint"),
     limit: int = Query(50, ge=1, le=1000),
-    offset: int = Query(0, ge=0)
-) -> JSONResponse:
+    offset: int = Query(0, ge=0),
+    ndjson: bool = Query(False, description="Stream one profile per line as NDJSON")
+):
     """List behavior profiles with optional filtering."""
     try:
         engine = get_risk_scoring_engine()
+        cached = engine.behavior_analyzer.profiles_cache.values()
         
-        # Get profiles from cache and database
-        profiles = []
-        
-        # For demo purposes, show cached profiles
-        for cache_key, profile in engine.behavior_analyzer.profiles_cache.items():
-            if identifier_type is None or profile.identifier_type == identifier_type:
-                
-                # Calculate risk trend
-                risk_trend = "stable"
-                if profile.violation_rate > 0.1:
-                    risk_trend = "increasing"
-                elif profile.trust_score > 0.8:
-                    risk_trend = "decreasing"
-                
-                profiles.append(BehaviorProfileResponse(
-                    identifier=profile.identifier,
-                    identifier_type=profile.identifier_type,
-                    total_requests=profile.total_requests,
-                    violation_count=profile.violation_count,
-                    violation_rate=profile.violation_rate,
-                    active_hours=profile.active_hours,
-                    active_days=profile.active_days,
-                    request_frequency=profile.request_frequency,
-                    typical_text_length=profile.typical_text_length,
-                    common_endpoints=profile.common_endpoints,
-                    trust_score=profile.trust_score,
-                    recent_anomalies=profile.recent_anomalies,
-                    last_violation=profile.last_violation,
-                    risk_trend=risk_trend,
-                    created_at=profile.created_at,
-                    updated_at=profile.updated_at
-                ))
-        
-        # Apply pagination
-        paginated_profiles = profiles[offset:offset + limit]
+        # Slice the matching profiles before building responses, so the
+        # construction cost is O(limit) rather than O(cache size)
+        matching = (
+            profile for profile in cached
+            if identifier_type is None or profile.identifier_type == identifier_type
+        )
+        page = itertools.islice(matching, offset, offset + limit)
+        
+        if ndjson:
+            # Emit one line per profile as it is built: memory stays
+            # constant and the first byte leaves before the page is done
+            def generate():
+                for profile in page:
+                    response = BehaviorProfileResponse.from_profile(
+                        profile, _compute_risk_trend(profile)
+                    )
+                    yield _ndjson_line(response.model_dump(mode="json"))
+            return StreamingResponse(generate(), media_type="application/x-ndjson")
+        
+        profiles = [
+            BehaviorProfileResponse.from_profile(profile, _compute_risk_trend(profile))
+            for profile in page
+        ]
+        total_profiles = (
+            len(cached) if identifier_type is None
+            else sum(1 for p in cached if p.identifier_type == identifier_type)
+        )
         
         return JSONResponse({
-            "profiles": [p.dict() for p in paginated_profiles],
-            "total_profiles": len(profiles),
+            "profiles": [p.model_dump(mode="json") for p in profiles],
+            "total_profiles": total_profiles,
             "limit": limit,
             "offset": offset,
-            "has_more": offset + limit < len(profiles)
+            "has_more": offset + limit < total_profiles
         })
         
     except Exception as e:
@@ -316,74 +411,63 @@ async def get_behavior_profile(
         
         profile = engine.behavior_analyzer.get_or_create_profile(identifier, identifier_type)
         
-        # Calculate risk trend
-        risk_trend = "stable"
-        if profile.violation_rate > 0.1:
-            risk_trend = "increasing"
-        elif profile.trust_score > 0.8:
-            risk_trend = "decreasing"
-        
-        return BehaviorProfileResponse(
-            identifier=profile.identifier,
-            identifier_type=profile.identifier_type,
-            total_requests=profile.total_requests,
-            violation_count=profile.violation_count,
-            violation_rate=profile.violation_rate,
-            active_hours=profile.active_hours,
-            active_days=profile.active_days,
-            request_frequency=profile.request_frequency,
-            typical_text_length=profile.typical_text_length,
-            common_endpoints=profile.common_endpoints,
-            trust_score=profile.trust_score,
-            recent_anomalies=profile.recent_anomalies,
-            last_violation=profile.last_violation,
-            risk_trend=risk_trend,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at
-        )
+        return BehaviorProfileResponse.from_profile(profile, _compute_risk_trend(profile))
         
     except Exception as e:
         logger.error(f"Profile retrieval failed: {e}")
         raise HTTPException(status_code=500, detail=f"Profile retrieval failed: {str(e)}")
 
 
+def _iter_recent_assessments(
+    limit: int,
+    risk_level: Optional[RiskLevel],
+    behavior_pattern: Optional[BehaviorPattern]
+):
+    """Yield recent assessment dicts, applying the optional filters.
+
+    This would query the risk_assessments table; for demo, yields mock
+    data one record at a time so both response modes consume it lazily.
+    """
+    for i in range(min(limit, 10)):
+        assessment = RiskAssessmentResponse(
+            risk_score=0.3 + (i * 0.1),
+            risk_level=RiskLevel.MEDIUM.value,
+            behavior_pattern=BehaviorPattern.NORMAL.value,
+            confidence=0.8,
+            contributing_factors=["policy_evaluation", "historical_patterns"],
+            anomaly_indicators=[],
+            recommended_action="standard_monitoring",
+            adaptive_threshold=0.5,
+            timestamp=datetime.now() - timedelta(minutes=i*5)
+        )
+        
+        # Apply filters
+        if risk_level and assessment.risk_level != risk_level.value:
+            continue
+        if behavior_pattern and assessment.behavior_pattern != behavior_pattern.value:
+            continue
+        
+        yield assessment.model_dump(mode="json")
+
+
 @risk_router.get("/assessments/recent")
 async def get_recent_assessments(
     limit: int = Query(100, ge=1, le=1000),
     risk_level: Optional[RiskLevel] = Query(None),
-    behavior_pattern: Optional[BehaviorPattern] = Query(None)
-) -> JSONResponse:
+    behavior_pattern: Optional[BehaviorPattern] = Query(None),
+    ndjson: bool = Query(False, description="Stream one assessment per line as NDJSON")
+):
     """Get recent risk assessments with optional filtering."""
     try:
-        engine = get_risk_scoring_engine()
+        records = _iter_recent_assessments(limit, risk_level, behavior_pattern)
         
-        # Get recent assessments from database
-        with engine.data_manager.db_path.open() as db:
-            # This would query the risk_assessments table
-            # For demo, return mock data
-            assessments = []
-            
-            for i in range(min(limit, 10)):
-                assessment = RiskAssessmentResponse(
-                    risk_score=0.3 + (i * 0.1),
-                    risk_level=RiskLevel.MEDIUM.value,
-                    behavior_pattern=BehaviorPattern.NORMAL.value,
-                    confidence=0.8,
-                    contributing_factors=["policy_evaluation", "historical_patterns"],
-                    anomaly_indicators=[],
-                    recommended_action="standard_monitoring",
-                    adaptive_threshold=0.5,
-                    timestamp=datetime.now() - timedelta(minutes=i*5)
-                )
-                
-                # Apply filters
-                if risk_level and assessment.risk_level != risk_level.value:
-                    continue
-                if behavior_pattern and assessment.behavior_pattern != behavior_pattern.value:
-                    continue
-                
-                assessments.append(assessment.dict())
+        if ndjson:
+            def generate():
+                for record in records:
+                    yield _ndjson_line(record)
+            return StreamingResponse(generate(), media_type="application/x-ndjson")
         
+        assessments = list(records)
         return JSONResponse({
             "assessments": assessments,
             "total_returned": len(assessments),
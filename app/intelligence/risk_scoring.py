@@ -5,32 +5,7 @@ ML-powered behavioral risk assessment with dynamic threshold adjustment
 This module implements intelligent risk scoring that learns from historical
 policy decisions and adapts to organizational behavior patterns:
 
-1. Historical Dec    def _serialize_profile(self, profile: BehaviorProfile) -> str:
-        """Serialize behavior profile to JSON, handling datetime objects."""
-        profile_dict = asdict(profile)
-        
-        # Convert datetime objects to ISO format strings
-        for key, value in profile_dict.items():
-            if isinstance(value, datetime):
-                profile_dict[key] = value.isoformat()
-            elif value is None:
-                profile_dict[key] = None
-        
-        return json.dumps(profile_dict)
-    
-    def store_behavior_profile(self, profile: BehaviorProfile):
-        """Store behavior profile in database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO behavior_profiles 
-                (identifier, identifier_type, profile_json, updated_at)
-                VALUES (?, ?, ?, ?)
-            """, (
-                profile.identifier,
-                profile.identifier_type,
-                self._serialize_profile(profile),
-                datetime.now().isoformat()
-            ))s - ML training on past evaluations
+1. Historical Decisions - ML training on past evaluations
 2. Behavioral Risk Profiling - User/endpoint risk patterns
 3. Dynamic Threshold Adjustment - Self-tuning confidence scores
 4. Anomaly Detection - Real-time behavioral deviation alerts
@@ -45,6 +20,7 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import sqlite3
 import hashlib
+from bisect import bisect_right
 from pathlib import Path
 from collections import defaultdict, deque
 import logging
@@ -82,6 +58,21 @@ class BehaviorPattern(str, Enum):
     MALICIOUS = "malicious"
 
 
+# Risk-level bucket boundaries, shared by the per-assessment path and the
+# SQL CASE expression in HistoricalDataManager.query_metrics. bisect_right
+# over the thresholds gives the same >=-based bucketing as the old if/elif
+# ladder in a single C-level binary search.
+_BUCKET_THRESHOLDS = (0.1, 0.3, 0.5, 0.7, 0.9)
+_BUCKET_LEVELS = (
+    RiskLevel.VERY_LOW,
+    RiskLevel.LOW,
+    RiskLevel.MEDIUM,
+    RiskLevel.HIGH,
+    RiskLevel.VERY_HIGH,
+    RiskLevel.CRITICAL,
+)
+
+
 @dataclass
 class RiskFeatures:
     """Feature set for risk scoring ML model."""
@@ -285,6 +276,147 @@ class HistoricalDataManager:
             
             return [dict(row) for row in cursor.fetchall()]
     
+    # Columns that may be requested through get_columnar_data; numeric ones
+    # come back as float arrays (NULL -> nan), the rest as object arrays.
+    _NUMERIC_COLUMNS = frozenset({
+        "id", "text_length", "confidence", "processing_time", "risk_score",
+    })
+    _TABLE_COLUMNS = _NUMERIC_COLUMNS | {
+        "timestamp", "request_id", "user_id", "agent_id", "endpoint",
+        "direction", "text_hash", "decision", "rule_ids", "features_json",
+        "created_at",
+    }
+    
+    def get_columnar_data(self, days: int = 30,
+                          columns: Tuple[str, ...] = ("risk_score", "decision")) -> Dict[str, np.ndarray]:
+        """Fetch recent decisions as a dict of per-column NumPy arrays.
+
+        Only the requested columns are read, and consumers get contiguous
+        arrays suitable for vectorized aggregation instead of a list of
+        per-row dicts.
+        """
+        for column in columns:
+            if column not in self._TABLE_COLUMNS:
+                raise ValueError(f"Unknown column: {column}")
+        since = datetime.now() - timedelta(days=days)
+        
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(f"""
+                SELECT {', '.join(columns)} FROM policy_decisions 
+                WHERE timestamp >= ?
+                ORDER BY timestamp DESC
+            """, (since.isoformat(),))
+            rows = cursor.fetchall()
+        
+        if not rows:
+            return {column: np.array([]) for column in columns}
+        
+        result = {}
+        for column, values in zip(columns, zip(*rows)):
+            if column in self._NUMERIC_COLUMNS:
+                result[column] = np.array(
+                    [v if v is not None else np.nan for v in values], dtype=np.float64
+                )
+            else:
+                result[column] = np.array(values, dtype=object)
+        return result
+    
+    def count_recent_decisions(self, days: int = 30) -> int:
+        """Count recent decisions without materializing any rows."""
+        since = datetime.now() - timedelta(days=days)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM policy_decisions WHERE timestamp >= ?",
+                (since.isoformat(),)
+            )
+            return cursor.fetchone()[0]
+    
+    # Identifier filters exposed through query_metrics; values are column
+    # names spliced into the SQL, so only this whitelist is accepted.
+    _IDENTIFIER_COLUMNS = {
+        "user": "user_id",
+        "agent": "agent_id",
+        "endpoint": "endpoint",
+    }
+
+    def _decision_filter(self, days: int, identifier: Optional[str],
+                         identifier_type: Optional[str]) -> Tuple[str, List[Any]]:
+        """Build the shared time + identifier WHERE clause and parameters."""
+        since = datetime.now() - timedelta(days=days)
+        where = "timestamp >= ?"
+        params: List[Any] = [since.isoformat()]
+        if identifier is not None and identifier_type in self._IDENTIFIER_COLUMNS:
+            where += f" AND {self._IDENTIFIER_COLUMNS[identifier_type]} = ?"
+            params.append(identifier)
+        return where, params
+    
+    def query_metrics(self, days: int = 30, identifier: Optional[str] = None,
+                      identifier_type: Optional[str] = None) -> Dict[str, Any]:
+        """Aggregate decision metrics in a single SQL scan.
+
+        Filtering, risk-level bucketing, violation and anomaly counts all
+        happen database-side, so callers get pre-aggregated numbers instead
+        of re-deriving them from thousands of raw rows in Python.
+        """
+        where, params = self._decision_filter(days, identifier, identifier_type)
+        
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(f"""
+                SELECT CASE
+                           WHEN risk_score >= 0.9 THEN 'critical'
+                           WHEN risk_score >= 0.7 THEN 'very_high'
+                           WHEN risk_score >= 0.5 THEN 'high'
+                           WHEN risk_score >= 0.3 THEN 'medium'
+                           WHEN risk_score >= 0.1 THEN 'low'
+                           ELSE 'very_low'
+                       END AS bucket,
+                       COUNT(*),
+                       SUM(COALESCE(risk_score, 0.0)),
+                       SUM(CASE WHEN decision IN ('block', 'flag') THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN risk_score > 0.7 THEN 1 ELSE 0 END)
+                FROM policy_decisions
+                WHERE {where}
+                GROUP BY bucket
+            """, params)
+            rows = cursor.fetchall()
+        
+        bucket_counts: Dict[str, int] = {}
+        total = 0
+        score_sum = 0.0
+        violation_count = 0
+        anomaly_count = 0
+        for bucket, count, bucket_score_sum, bucket_violations, bucket_anomalies in rows:
+            bucket_counts[bucket] = count
+            total += count
+            score_sum += bucket_score_sum
+            violation_count += bucket_violations
+            anomaly_count += bucket_anomalies
+        
+        return {
+            "bucket_counts": bucket_counts,
+            "total": total,
+            "average_risk_score": score_sum / total if total else 0.0,
+            "violation_count": violation_count,
+            "anomaly_count": anomaly_count,
+        }
+    
+    def count_off_hours(self, days: int = 30, identifier: Optional[str] = None,
+                        identifier_type: Optional[str] = None) -> int:
+        """Count decisions made during off hours (before 06:00 or after 22:00).
+
+        Mirrors the off_hours_access definition in feature extraction, but
+        evaluated database-side over the retention window.
+        """
+        where, params = self._decision_filter(days, identifier, identifier_type)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(f"""
+                SELECT COUNT(*) FROM policy_decisions
+                WHERE {where}
+                  AND (CAST(strftime('%H', timestamp) AS INTEGER) < 6
+                       OR CAST(strftime('%H', timestamp) AS INTEGER) > 22)
+            """, params)
+            return cursor.fetchone()[0]
+    
     def get_behavior_profile(self, identifier: str, identifier_type: str) -> Optional[BehaviorProfile]:
         """Get behavior profile for user/agent/endpoint."""
         with sqlite3.connect(self.db_path) as conn:
@@ -299,6 +431,19 @@ class HistoricalDataManager:
                 return BehaviorProfile(**profile_data)
             return None
     
+    def _serialize_profile(self, profile: BehaviorProfile) -> str:
+        """Serialize behavior profile to JSON, handling datetime objects."""
+        profile_dict = asdict(profile)
+        
+        # Convert datetime objects to ISO format strings
+        for key, value in profile_dict.items():
+            if isinstance(value, datetime):
+                profile_dict[key] = value.isoformat()
+            elif value is None:
+                profile_dict[key] = None
+        
+        return json.dumps(profile_dict)
+    
     def store_behavior_profile(self, profile: BehaviorProfile):
         """Store or update behavior profile."""
         with sqlite3.connect(self.db_path) as conn:
@@ -309,7 +454,7 @@ class HistoricalDataManager:
             """, (
                 profile.identifier,
                 profile.identifier_type,
-                json.dumps(asdict(profile)),
+                self._serialize_profile(profile),
                 datetime.now().isoformat()
             ))
     
@@ -526,36 +671,34 @@ class RiskScoringEngine:
             return
         
         try:
-            # Get training data
-            historical_data = self.data_manager.get_historical_data(days=30)
+            # Get training data: only the two columns training reads
+            data = self.data_manager.get_columnar_data(
+                days=30, columns=("features_json", "decision")
+            )
+            features_json = data["features_json"]
             
-            if len(historical_data) < 100:
+            if len(features_json) < 100:
                 logger.info("Insufficient data for ML model training")
                 return
             
-            # Prepare features and labels
-            features = []
-            labels = []
-            
-            for record in historical_data:
-                if record['features_json']:
-                    feature_dict = json.loads(record['features_json'])
-                    risk_features = RiskFeatures(**feature_dict)
-                    features.append(risk_features.to_array())
-                    
-                    # Create risk level label from decision
-                    if record['decision'] == 'block':
-                        labels.append(4)  # Very high risk
-                    elif record['decision'] == 'flag':
-                        labels.append(2)  # Medium risk
-                    else:
-                        labels.append(1)  # Low risk
+            # Feature rows still need per-record JSON decoding, but the
+            # decision -> label mapping is vectorized over the column
+            mask = np.array([bool(fj) for fj in features_json])
+            features = [
+                RiskFeatures(**json.loads(fj)).to_array()
+                for fj in features_json[mask]
+            ]
             
             if len(features) < 50:
                 return
             
+            decisions = data["decision"][mask]
             X = np.array(features)
-            y = np.array(labels)
+            y = np.select(
+                [decisions == "block", decisions == "flag"],
+                [4, 2],  # Very high / medium risk
+                default=1  # Low risk
+            )
             
             # Scale features
             X_scaled = self.scaler.fit_transform(X)
@@ -746,18 +889,7 @@ class RiskScoringEngine:
     
     def _determine_risk_level(self, risk_score: float) -> RiskLevel:
         """Convert numeric risk score to risk level."""
-        if risk_score >= 0.9:
-            return RiskLevel.CRITICAL
-        elif risk_score >= 0.7:
-            return RiskLevel.VERY_HIGH
-        elif risk_score >= 0.5:
-            return RiskLevel.HIGH
-        elif risk_score >= 0.3:
-            return RiskLevel.MEDIUM
-        elif risk_score >= 0.1:
-            return RiskLevel.LOW
-        else:
-            return RiskLevel.VERY_LOW
+        return _BUCKET_LEVELS[bisect_right(_BUCKET_THRESHOLDS, risk_score)]
     
     def _determine_behavior_pattern(self, risk_score: float, 
                                   anomalies: List[str]) -> BehaviorPattern:
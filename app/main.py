@@ -1,5 +1,6 @@
 # app/main.py
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
+import array
 import time
 import os
 from typing import Any, Dict, Deque
@@ -151,14 +152,35 @@ metrics_shadow = defaultdict(int)  # Track shadow decisions
 # API key from config
 API_KEY = config.app.api_key
 
-# simple in-memory metrics
-METRICS_TOTALS: Dict[str, int] = defaultdict(int)
-METRICS_RULES: Dict[str, int] = defaultdict(int)
-METRICS_SHADOW: Dict[str, int] = defaultdict(int)
-METRICS_ENDPOINTS: Dict[str, int] = defaultdict(int)
-METRICS_DIRECTIONS: Dict[str, int] = defaultdict(int)
+# simple in-memory metrics; Counters are pre-seeded with the known
+# decision keys so hot-path increments never hit the __missing__ path
+METRICS_TOTALS: Counter = Counter({"total": 0, "allow": 0, "flag": 0, "block": 0})
+METRICS_SHADOW: Counter = Counter()
+METRICS_ENDPOINTS: Counter = Counter()
+METRICS_DIRECTIONS: Counter = Counter()
 RECENT_DECISIONS: Deque[Dict[str, Any]] = deque(maxlen=100)
 
+# Per-rule hit counts live in a flat unsigned array indexed through a
+# stable rule_id -> slot table, so recording a hit is a single C-level
+# array store instead of a hash-map insert per matched rule
+_RULE_INDEX: Dict[str, int] = {}
+RULE_HITS = array.array("Q")
+
+
+def _record_rule_hits(rule_ids: list) -> None:
+    """Bump the hit counter for each matched rule."""
+    for rule_id in rule_ids:
+        idx = _RULE_INDEX.get(rule_id)
+        if idx is None:
+            idx = _RULE_INDEX[rule_id] = len(RULE_HITS)
+            RULE_HITS.append(0)
+        RULE_HITS[idx] += 1
+
+
+def _rule_hits_dict() -> Dict[str, int]:
+    """Materialize the rule-hit array as a dict for metrics responses."""
+    return {rule_id: RULE_HITS[idx] for rule_id, idx in _RULE_INDEX.items()}
+
 
 @app.get(
     "/health",
@@ -321,7 +343,7 @@ async def admin_metrics(request: Request) -> Dict[str, Any]:
         return {
             "total_requests": METRICS_TOTALS.get("total", 0),
             "decisions": dict(METRICS_TOTALS),
-            "rules": dict(METRICS_RULES),
+            "rules": _rule_hits_dict(),
             "shadow_decisions": dict(metrics_shadow),
             "circuit_states": circuit_manager.get_all_states(),
             "deadletter_stats": deadletter_queue.get_stats(),
@@ -638,6 +660,17 @@ async def evaluate_text(request: EvaluateRequest):
     # Apply shadow logic
     raw_decision, effective_decision = apply_shadow_logic(decision, rule_ids)
 
+    # Update in-memory metrics: pre-seeded Counter bumps plus one array
+    # store per matched rule
+    METRICS_TOTALS["total"] += 1
+    METRICS_TOTALS[effective_decision.lower()] += 1
+    if rule_ids:
+        _record_rule_hits(rule_ids)
+    if raw_decision != effective_decision:
+        METRICS_SHADOW[raw_decision.lower()] += 1
+    METRICS_ENDPOINTS[request.endpoint or "/v1/evaluate"] += 1
+    METRICS_DIRECTIONS[request.direction or "inbound"] += 1
+
     # Log to enhanced audit chain (tamper-evident)
     log_policy_decision(
         action=effective_decision.lower() if effective_decision else "allow",
@@ -716,7 +749,7 @@ async def metrics() -> Dict[str, Any]:
     return {
         "shadow_mode": SHADOW_MODE,
         "totals": dict(METRICS_TOTALS),
-        "rules": dict(METRICS_RULES),
+        "rules": _rule_hits_dict(),
         "shadow_overrides": dict(METRICS_SHADOW),
         "endpoints": dict(METRICS_ENDPOINTS),
         "directions": dict(METRICS_DIRECTIONS),
@@ -739,31 +772,27 @@ async def audit_statistics() -> Dict[str, Any]:
 @app.get("/v1/audit/sarif")
 async def audit_sarif(date_prefix: str = None) -> Dict[str, Any]:
     """Return audit logs in SARIF format."""
-    records = audit.get_records_by_date_prefix(date_prefix)
-
-    # Convert audit records to SARIF results
-    results = []
-    for record in records:
-        if record.action in ["block", "flag"]:
-            results.append(
+    # Filtering happens in iter_audits, so only matching records are
+    # validated and materialized; the SARIF build is one list construction
+    results = [
+        {
+            "ruleId": "+".join(record.rule_ids) if record.rule_ids else "unknown",
+            "level": "error" if record.action == "block" else "warning",
+            "message": {
+                "text": f"Content {'blocked' if record.action == 'block' else 'flagged'} due to policy violation."
+            },
+            "locations": [
                 {
-                    "ruleId": "+".join(record.rule_ids)
-                    if record.rule_ids
-                    else "unknown",
-                    "level": "error" if record.action == "block" else "warning",
-                    "message": {
-                        "text": f"Content {'blocked' if record.action == 'block' else 'flagged'} due to policy violation."
-                    },
-                    "locations": [
-                        {
-                            "physicalLocation": {
-                                "artifactLocation": {"uri": record.endpoint},
-                                "region": {"snippet": {"text": record.text_excerpt}},
-                            }
-                        }
-                    ],
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": record.endpoint},
+                        "region": {"snippet": {"text": record.text_excerpt}},
+                    }
                 }
-            )
+            ],
+        }
+        for record in audit.iter_audits(date_prefix=date_prefix)
+        if record.action in ("block", "flag")
+    ]
 
     return {
         "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
@@ -30,6 +30,11 @@ class Rule(BaseModel):
     }
 
 
+class BaseResponse(BaseModel):
+    success: bool = True
+    message: str = ""
+
+
 class EvaluateRequest(BaseModel):
     api_key: str
     text: str
@@ -51,6 +51,8 @@ class Telemetry:
                     token=self.cfg.siem.splunk.hec_token,
                     sourcetype="jimini:event",
                     verify=self.cfg.siem.splunk.verify_tls,
+                    gzip=self.cfg.siem.splunk.gzip,
+                    gzip_level=self.cfg.siem.splunk.gzip_level,
                 )
             )
         if self.cfg.siem.elastic.enabled:
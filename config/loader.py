@@ -6,6 +6,7 @@ Merges YAML + .env with precedence, typed validation, fail-fast behavior.
 
 import os
 import sys
+import threading
 import yaml
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Union
@@ -55,7 +56,9 @@ class SplunkConfig(BaseModel):
     hec_token: Optional[str] = None
     index: str = "main"
     verify_tls: bool = True
-    
+    gzip: bool = False
+    gzip_level: int = Field(default=6, ge=1, le=9)
+
     @validator('hec_url')
     def validate_hec_url_if_enabled(cls, v, values):
         if values.get('enabled') and not v:
@@ -310,12 +313,31 @@ def mask_secrets(config: Config) -> Dict[str, Any]:
 # Global config instance (lazy loaded)
 _config_instance: Optional[Config] = None
 
+# Resolved shadow-mode flag published for hot-path readers. Module attribute
+# reads are atomic in CPython, so per-decision code can read this directly
+# instead of re-resolving config + environment. Writers hold the lock.
+current_shadow_mode: bool = os.environ.get("JIMINI_SHADOW", "false").lower() == "true"
+_shadow_mode_lock = threading.Lock()
+
+
+def _publish_shadow_mode(config: Optional[Config]) -> None:
+    """Update the published shadow-mode flag after a config (re)load."""
+    global current_shadow_mode
+    with _shadow_mode_lock:
+        if config is not None and config.app is not None:
+            current_shadow_mode = config.app.shadow_mode
+        else:
+            current_shadow_mode = (
+                os.environ.get("JIMINI_SHADOW", "false").lower() == "true"
+            )
+
 
 def get_current_config() -> Config:
     """Get the current global config instance"""
     global _config_instance
     if _config_instance is None:
         _config_instance = get_config()
+        _publish_shadow_mode(_config_instance)
     return _config_instance
 
 
@@ -323,4 +345,5 @@ def reload_config(config_path: Optional[str] = None) -> Config:
     """Reload configuration from file"""
     global _config_instance
     _config_instance = get_config(config_path)
+    _publish_shadow_mode(_config_instance)
     return _config_instance
\ No newline at end of file
@@ -157,8 +157,6 @@ def evaluate(
         hit = False
 
         # Regex (with optional min_count)
-        import re
-
         regex_arg: Optional[re.Pattern[str]] = (
             compiled_regex if isinstance(compiled_regex, re.Pattern) else None
         )
@@ -173,7 +173,7 @@ class RLDemoScenarios:
             print(f"\n   Cycle {i+1}:")
             
             # Select action
-            action = await bandit.select_policy_action(context)
+            action = bandit.select_policy_action(context)
             action_history.append(action)
             
             print(f"   🎯 Selected Action: {action.value}")
@@ -190,7 +190,7 @@ class RLDemoScenarios:
             reward_history.append(reward.total_reward)
             
             # Update bandit
-            await bandit.update_policy(context, action, reward)
+            bandit.update_policy(context, action, reward)
             
             print(f"   💰 Total Reward: {reward.total_reward:.2f}")
             print(f"   📈 Total Trials: {bandit.total_trials}")
@@ -448,12 +448,12 @@ class RLDemoScenarios:
         print(f"   Shadow Mode Active: {metrics['shadow_mode']}")
         
         # Action distribution analysis
+        actions = ["ALLOW", "FLAG", "BLOCK", "ESCALATE", "SHADOW_TEST"]
         if sum(metrics['action_distribution']) > 0:
             total_actions = sum(metrics['action_distribution'])
             action_percentages = [count/total_actions*100 for count in metrics['action_distribution']]
             
             print(f"\n🎯 Action Distribution:")
-            actions = ["ALLOW", "FLAG", "BLOCK", "ESCALATE", "SHADOW_TEST"]
             for i, (action, percentage) in enumerate(zip(actions, action_percentages)):
                 if i < len(action_percentages):
                     print(f"   {action}: {percentage:.1f}%")
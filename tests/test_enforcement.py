@@ -149,3 +149,48 @@ def test_max_chars():
     result2 = mock_evaluate([mock_rule], request2, str(uuid.uuid4()))
     assert result2.action == "block"
     assert "MAX-CHARS-1.0" in result2.rule_ids
+
+
+def test_required_literal_extraction():
+    """Prefilter literal extraction is conservative about regex syntax"""
+    from app.enforcement import _required_literal
+
+    # Plain literal prefixes are extracted
+    assert _required_literal(r"ghp_[A-Za-z0-9]{36}") == "ghp_"
+    assert _required_literal(r"AKIA[0-9A-Z]{16}") == "AKIA"
+    assert _required_literal(r"^sk-[A-Za-z0-9]{20}") == "sk-"
+
+    # Quantifiers make the preceding char optional, so it is dropped
+    assert _required_literal(r"abcd?x") == "abc"
+
+    # Alternation, inline flags, or short literals yield no prefilter
+    assert _required_literal(r"foo|bar") is None
+    assert _required_literal(r"(?i)token") is None
+    assert _required_literal(r"ab[0-9]+") is None
+
+
+def test_prefilter_preserves_decisions():
+    """Evaluation results are identical with and without candidate literals present"""
+    from app.enforcement import evaluate
+
+    rule = Rule(
+        id="GHP-TEST-1.0",
+        title="GitHub Token",
+        severity="HIGH",
+        pattern=r"ghp_[A-Za-z0-9]{36}",
+        action=Action.BLOCK,
+    )
+    rule.compiled_pattern = re.compile(rule.pattern)
+    rules_store = {rule.id: (rule, rule.compiled_pattern)}
+
+    decision, rule_ids, _ = evaluate(
+        "token: ghp_" + "a" * 36, "agent", rules_store, "outbound", "/test"
+    )
+    assert decision == "block"
+    assert "GHP-TEST-1.0" in rule_ids
+
+    decision, rule_ids, _ = evaluate(
+        "no secrets here", "agent", rules_store, "outbound", "/test"
+    )
+    assert decision == "allow"
+    assert not rule_ids
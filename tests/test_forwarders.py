@@ -7,17 +7,17 @@ from app.forwarders.elastic_forwarder import ElasticForwarder
 
 
 def test_splunk_hec_forwarder_headers_and_payload():
-    # Mock urlopen
-    with patch("urllib.request.urlopen") as mock_urlopen:
-        mock_response = MagicMock()
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-
-        # Create forwarder and send events
-        forwarder = SplunkHECForwarder(
-            url="https://splunk.example.com:8088/services/collector",
-            token="test-token",
-            sourcetype="jimini:event",
-        )
+    # Create forwarder and mock its pooled HTTP client
+    forwarder = SplunkHECForwarder(
+        url="https://splunk.example.com:8088/services/collector",
+        token="test-token",
+        sourcetype="jimini:event",
+    )
+
+    mock_response = MagicMock()
+    mock_response.status = 200
+    with patch.object(forwarder, "_http") as mock_http:
+        mock_http.request.return_value = mock_response
 
         events = [
             {"ts": "2023-01-01T00:00:00Z", "decision": "BLOCK"},
@@ -27,15 +27,18 @@ def test_splunk_hec_forwarder_headers_and_payload():
         forwarder.send_many(events)
 
         # Get request from mock
-        args, kwargs = mock_urlopen.call_args
-        request = args[0]
+        args, kwargs = mock_http.request.call_args
+        assert args[:2] == ("POST", forwarder.url)
+        headers = kwargs["headers"]
 
         # Check headers
-        assert request.get_header("Content-type") == "application/json"
-        assert request.get_header("Authorization") == "Splunk test-token"
+        assert headers["Content-Type"] == "application/json"
+        assert headers["Authorization"] == "Splunk test-token"
 
-        # Check payload format
-        payload_lines = request.data.decode().split("\n")
+        # Check payload format (body is an iterable of newline-terminated
+        # fragments sent with chunked transfer encoding)
+        body = b"".join(kwargs["body"])
+        payload_lines = body.decode().strip().split("\n")
         assert len(payload_lines) == 2
 
         # Each line should be a JSON object with event and sourcetype
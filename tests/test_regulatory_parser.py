@@ -12,7 +12,11 @@ from app.intelligence.regulatory_parser import (
     RegulatoryTextParser, RegulationType, RequirementType,
     PolicyRequirement, GeneratedRule, create_sample_gdpr_text
 )
-from app.intelligence.config import load_intelligence_config, get_regulation_config
+from app.intelligence.config import (
+    load_intelligence_config,
+    get_regulation_config,
+    reload_intelligence_config,
+)
 
 
 class TestRegulatoryTextParser:
@@ -255,7 +259,12 @@ class TestRegulatoryTextParser:
     def test_fallback_without_spacy(self, mock_spacy_load, sample_gdpr_text):
         """Test that parser works without spaCy (fallback mode)."""
         mock_spacy_load.side_effect = OSError("Model not found")
-        
+
+        # The pipeline is cached at module level; drop it so the patched
+        # loader is actually consulted.
+        from app.intelligence.regulatory_parser import _get_nlp
+        _get_nlp.cache_clear()
+
         parser = RegulatoryTextParser()
         assert parser.nlp is None
         
@@ -326,6 +335,15 @@ class TestIntelligenceConfig:
         hipaa_config = get_regulation_config("hipaa")
         assert hipaa_config is not None
         assert "PHI" in hipaa_config.keywords
+
+    def test_regulation_keyword_matching(self):
+        """Test single-pass keyword matching against document text."""
+        gdpr_config = get_regulation_config("gdpr")
+        text = "Processing of personal data requires consent from the data subject."
+        terms = {term for _, term in gdpr_config.find_matches(text)}
+        assert "personal data" in terms
+        assert "consent" in terms
+        assert "data subject" in terms
     
     @patch.dict('os.environ', {
         'JIMINI_AI_MIN_CONFIDENCE': '0.6',
@@ -334,11 +352,15 @@ class TestIntelligenceConfig:
     })
     def test_environment_overrides(self):
         """Test configuration overrides from environment."""
-        config = load_intelligence_config()
-        
-        assert config.min_confidence_threshold == 0.6
-        assert config.auto_approval_threshold == 0.9
-        assert config.enable_auto_approval is True
+        reload_intelligence_config()
+        try:
+            config = load_intelligence_config()
+
+            assert config.min_confidence_threshold == 0.6
+            assert config.auto_approval_threshold == 0.9
+            assert config.enable_auto_approval is True
+        finally:
+            reload_intelligence_config()
 
 
 class TestIntegrationScenarios:
@@ -202,7 +202,7 @@ class TestContextualBandit:
             time_of_day=0.3
         )
         
-        action = await bandit.select_policy_action(context)
+        action = bandit.select_policy_action(context)
         assert isinstance(action, PolicyAction)
         
     @pytest.mark.asyncio
@@ -214,7 +214,7 @@ class TestContextualBandit:
         
         initial_trials = bandit.total_trials
         
-        await bandit.update_policy(context, action, reward)
+        bandit.update_policy(context, action, reward)
         
         assert bandit.total_trials == initial_trials + 1
         assert len(bandit.context_history) == 1
@@ -232,7 +232,7 @@ class TestContextualBandit:
             safety_penalty=0.5  # Above threshold
         )
         
-        await bandit.update_policy(context, action, reward)
+        bandit.update_policy(context, action, reward)
         
         # Check that reward was adjusted for safety
         assert bandit.reward_history[-1] < 1.0
@@ -246,7 +246,7 @@ class TestContextualBandit:
         )
         
         context = RLContext(user_risk_score=0.5)
-        action = await bandit.select_policy_action(context)
+        action = bandit.select_policy_action(context)
         assert isinstance(action, PolicyAction)
 
 
@@ -322,6 +322,7 @@ class TestPolicyOptimizer:
         }
         
         await optimizer.provide_feedback("test-id", context, action, outcome)
+        await optimizer.flush_feedback()
         
         # Check that bandit was updated
         assert optimizer.bandit.total_trials > 0
@@ -357,7 +358,7 @@ class TestPolicyOptimizer:
         context = RLContext(user_risk_score=0.5)
         
         # Initial confidence should be low
-        confidence = await optimizer._calculate_confidence(context)
+        confidence = optimizer._calculate_confidence(context)
         assert 0 <= confidence <= 1
         
         # Add some history
@@ -365,7 +366,7 @@ class TestPolicyOptimizer:
             optimizer.bandit.context_history.append(context.to_vector())
         
         # Confidence should increase with more data
-        new_confidence = await optimizer._calculate_confidence(context)
+        new_confidence = optimizer._calculate_confidence(context)
         assert new_confidence >= confidence
         
     @pytest.mark.asyncio
@@ -373,17 +374,17 @@ class TestPolicyOptimizer:
         """Test reward calculation from outcomes"""
         # Positive outcome
         positive_outcome = {"user_feedback": 1, "security_breach": False}
-        positive_reward = await optimizer._calculate_reward(PolicyAction.ALLOW, positive_outcome)
+        positive_reward = optimizer._calculate_reward(PolicyAction.ALLOW, positive_outcome)
         assert positive_reward.total_reward > 0
         
         # Security breach
         breach_outcome = {"user_feedback": 0, "security_breach": True}
-        breach_reward = await optimizer._calculate_reward(PolicyAction.ALLOW, breach_outcome)
+        breach_reward = optimizer._calculate_reward(PolicyAction.ALLOW, breach_outcome)
         assert breach_reward.total_reward < 0  # Should be penalized
         
         # False positive
         fp_outcome = {"user_feedback": -1, "false_positive": True}
-        fp_reward = await optimizer._calculate_reward(PolicyAction.BLOCK, fp_outcome)
+        fp_reward = optimizer._calculate_reward(PolicyAction.BLOCK, fp_outcome)
         assert fp_reward.total_reward < 0  # Should be penalized
         
     @pytest.mark.asyncio
@@ -394,7 +395,7 @@ class TestPolicyOptimizer:
         action = PolicyAction.ALLOW
         reward = RLReward(immediate_reward=0.8)
         
-        await optimizer.bandit.update_policy(context, action, reward)
+        optimizer.bandit.update_policy(context, action, reward)
         
         metrics = await optimizer.get_optimization_metrics()
         
@@ -595,6 +596,7 @@ class TestRLPerformance:
             outcome = {"user_feedback": 1 if i % 3 == 0 else 0}
             
             await optimizer.provide_feedback(f"test-{i}", context, action, outcome)
+        await optimizer.flush_feedback()
         
         metrics = await optimizer.get_optimization_metrics()
         assert metrics["total_trials"] == 50